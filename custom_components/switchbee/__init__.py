@@ -2,90 +2,118 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
-import re
-
-from aiohttp import ClientSession
-from switchbee.api import CentralUnitPolling, CentralUnitWsRPC, is_wsrpc_api
-from switchbee.api.central_unit import SwitchBeeError
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME, Platform
-from homeassistant.core import HomeAssistant, callback
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.core import HomeAssistant
 import homeassistant.helpers.entity_registry as er
 import homeassistant.helpers.device_registry as dr
+from homeassistant.helpers.typing import ConfigType
 
 from .const import DOMAIN
-from .coordinator import SwitchBeeCoordinator
+from .coordinator import SwitchBeeCoordinator, scenario_members_store
+from .migration import UniqueIdMigration
+from .services import async_setup_services, async_unload_services
+from .session import async_get_session_manager
 
 _LOGGER = logging.getLogger(__name__)
 
 
-PLATFORMS: list[Platform] = [
-    Platform.BUTTON,
-    Platform.CLIMATE,
-    Platform.COVER,
-    Platform.LIGHT,
-    Platform.SWITCH,
-]
-
+async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
+    """Start connecting to the Central Units while Home Assistant is starting."""
+    manager = async_get_session_manager(hass)
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if not entry.disabled_by:
+            manager.async_prewarm(entry)
 
-async def get_api_object(
-    central_unit: str, user: str, password: str, websession: ClientSession
-) -> CentralUnitPolling | CentralUnitWsRPC:
-    """Return SwitchBee API object."""
-
-    api: CentralUnitPolling | CentralUnitWsRPC = CentralUnitPolling(
-        central_unit, user, password, websession
-    )
-    # First try to connect and fetch the version
-    try:
-        await api.connect()
-    except SwitchBeeError as exp:
-        raise ConfigEntryNotReady("Failed to connect to the Central Unit") from exp
-
-    # Check if websocket version
-    if is_wsrpc_api(api):
-        api = CentralUnitWsRPC(central_unit, user, password, websession)
-        await api.connect()
-
-    return api
+    return True
 
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up SwitchBee Smart Home from a config entry."""
 
     hass.data.setdefault(DOMAIN, {})
-    central_unit = entry.data[CONF_HOST]
-    user = entry.data[CONF_USERNAME]
-    password = entry.data[CONF_PASSWORD]
-    websession = async_get_clientsession(hass, verify_ssl=False)
-    api = await get_api_object(central_unit, user, password, websession)
+    api = await async_get_session_manager(hass).async_get_api(entry)
 
     coordinator = SwitchBeeCoordinator(
         hass,
         api,
+        entry.options,
     )
 
+    await coordinator.async_load_scenario_members()
     await coordinator.async_config_entry_first_refresh()
     entry.async_on_unload(entry.add_update_listener(update_listener))
     hass.data[DOMAIN][entry.entry_id] = coordinator
+    async_setup_services(hass)
 
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # only set up the platforms having devices. The Central Unit configuration
+    # is read on every setup (the library does not report changes to it), so a
+    # reload sets up the platforms of device types added since.
+    await _async_forward_new_platforms(hass, entry, coordinator)
+
+    # thermostats, VRF ACs and scenarios are set up after the others
+    coordinator.deferred_setup = entry.async_create_background_task(
+        hass,
+        _async_load_deferred_platforms(hass, entry, coordinator),
+        f"{DOMAIN} deferred devices",
+    )
 
     return True
 
 
+async def _async_load_deferred_platforms(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SwitchBeeCoordinator
+) -> None:
+    """Load the states of the deferred devices and set up their platforms."""
+    await coordinator.async_load_deferred_devices()
+    # a regular task is awaited on stop, a background task would be cancelled
+    # halfway through the platform setup
+    coordinator.deferred_setup = entry.async_create_task(
+        hass, _async_forward_new_platforms(hass, entry, coordinator)
+    )
+
+
+async def _async_forward_new_platforms(
+    hass: HomeAssistant, entry: ConfigEntry, coordinator: SwitchBeeCoordinator
+) -> None:
+    """Set up the platforms that have devices but are not loaded yet."""
+    if not (platforms := coordinator.platforms - coordinator.loaded_platforms):
+        return
+
+    _LOGGER.debug("Setting up platforms %s", platforms)
+    coordinator.loaded_platforms |= platforms
+    await hass.config_entries.async_forward_entry_setups(entry, platforms)
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
-    if unload_ok := await hass.config_entries.async_unload_platforms(entry, PLATFORMS):
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    await coordinator.async_stop_capture()
+    if (task := coordinator.deferred_setup) is not None and not task.done():
+        if coordinator.deferred_platforms_pending:
+            # still loading the deferred states, no platform was set up yet
+            task.cancel()
+        # otherwise let the deferred platforms finish setting up to unload them too
+        await asyncio.wait((task,))
+    if unload_ok := await hass.config_entries.async_unload_platforms(
+        entry, coordinator.loaded_platforms
+    ):
         hass.data[DOMAIN].pop(entry.entry_id)
+        async_unload_services(hass)
+        # a reload picks the session up again, otherwise it is closed when idle
+        async_get_session_manager(hass).async_release_when_idle(entry.entry_id)
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Close the Central Unit session and drop the stored data of a removed entry."""
+    async_get_session_manager(hass).async_release(entry.entry_id)
+    await scenario_members_store(hass, entry.entry_id).async_remove()
+
+
 async def update_listener(hass: HomeAssistant, config_entry: ConfigEntry) -> None:
     """Update listener."""
     await hass.config_entries.async_reload(config_entry.entry_id)
@@ -96,68 +124,55 @@ async def async_migrate_entry(hass: HomeAssistant, config_entry: ConfigEntry) ->
     _LOGGER.debug("Migrating from version %s", config_entry.version)
 
     if config_entry.version == 1:
-        dev_reg = dr.async_get(hass)
-        websession = async_get_clientsession(hass, verify_ssl=False)
         old_unique_id = config_entry.unique_id
-        api = await get_api_object(
-            config_entry.data[CONF_HOST],
-            config_entry.data[CONF_USERNAME],
-            config_entry.data[CONF_PASSWORD],
-            websession,
-        )
+        assert isinstance(old_unique_id, str)
+        # the session (and its unique ID) is reused by async_setup_entry right after
+        api = await async_get_session_manager(hass).async_get_api(config_entry)
         new_unique_id = api.unique_id
 
-        @callback
-        def update_unique_id(entity_entry: er.RegistryEntry) -> dict[str, str] | None:
-            """Update unique ID of entity entry."""
-            assert isinstance(old_unique_id, str)
-            if match := re.match(
-                rf"(?:{old_unique_id})-(?P<id>\d+)", entity_entry.unique_id
-            ):
-                entity_new_unique_id = f'{new_unique_id}-{match.group("id")}'
-                _LOGGER.info(
-                    "Migrating entity %s from %s to new id %s",
-                    entity_entry.entity_id,
-                    entity_entry.unique_id,
-                    entity_new_unique_id,
-                )
-                return {"new_unique_id": entity_new_unique_id}
-
-            return None
-
         if new_unique_id:
+            migration = UniqueIdMigration(old_unique_id, new_unique_id)
+
             # Migrate devices
-            for device_entry in dr.async_entries_for_config_entry(
-                dev_reg, config_entry.entry_id
-            ):
-                assert isinstance(device_entry, dr.DeviceEntry)
-                for identifier in device_entry.identifiers:
-                    if match := re.match(
-                        rf"(?P<id>.+)-{old_unique_id}$", identifier[1]
-                    ):
-                        new_identifiers = {
-                            (
-                                DOMAIN,
-                                f"{match.group('id')}-{new_unique_id}",
-                            )
-                        }
-                        _LOGGER.info(
-                            "Migrating device %s identifiers from %s to %s",
-                            device_entry.name,
-                            device_entry.identifiers,
-                            new_identifiers,
-                        )
-                        dev_reg.async_update_device(
-                            device_entry.id, new_identifiers=new_identifiers
-                        )
+            dev_reg = dr.async_get(hass)
+            device_updates = {
+                device_entry.id: new_identifiers
+                for device_entry in dr.async_entries_for_config_entry(
+                    dev_reg, config_entry.entry_id
+                )
+                if (
+                    new_identifiers := migration.device_identifiers(
+                        device_entry.identifiers
+                    )
+                )
+            }
+            for device_id, new_identifiers in device_updates.items():
+                dev_reg.async_update_device(device_id, new_identifiers=new_identifiers)
 
             # Migrate entities
-            await er.async_migrate_entries(
-                hass, config_entry.entry_id, update_unique_id
+            ent_reg = er.async_get(hass)
+            entity_entries = er.async_entries_for_config_entry(
+                ent_reg, config_entry.entry_id
+            )
+            unique_id_map = migration.entity_unique_ids(
+                entity_entry.unique_id for entity_entry in entity_entries
+            )
+            for entity_entry in entity_entries:
+                if entity_entry.unique_id in unique_id_map:
+                    ent_reg.async_update_entity(
+                        entity_entry.entity_id,
+                        new_unique_id=unique_id_map[entity_entry.unique_id],
+                    )
+
+            _LOGGER.info(
+                "Migrated %i devices and %i entities from %s to %s",
+                len(device_updates),
+                len(unique_id_map),
+                old_unique_id,
+                new_unique_id,
             )
-
             config_entry.version = 2
 
         _LOGGER.info("Migration to version %s successful", config_entry.version)
 
-    return True
\ No newline at end of file
+    return True
@@ -1,10 +1,10 @@
 """Support for SwitchBee scenario button."""
 
 from switchbee.api.central_unit import SwitchBeeError
-from switchbee.device import ApiStateCommand, DeviceType
 
 from homeassistant.components.button import ButtonEntity
 from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
 from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
@@ -21,8 +21,7 @@ async def async_setup_entry(
     coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
         SwitchBeeButton(switchbee_device, coordinator)
-        for switchbee_device in coordinator.data.values()
-        if switchbee_device.type == DeviceType.Scenario
+        for switchbee_device in coordinator.platform_devices.get(Platform.BUTTON, [])
     )
 
 
@@ -32,7 +31,7 @@ class SwitchBeeButton(SwitchBeeEntity, ButtonEntity):
     async def async_press(self) -> None:
         """Fire the scenario in the SwitchBee hub."""
         try:
-            await self.coordinator.api.set_state(self._device.id, ApiStateCommand.ON)
+            await self.coordinator.async_fire_scenario(self._device.id)
         except SwitchBeeError as exp:
             raise HomeAssistantError(
                 f"Failed to fire scenario {self.name}, {str(exp)}"
@@ -0,0 +1,95 @@
+"""Capture of the Central Unit traffic, replayed by scripts/replay_capture.py."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+import gzip
+import json
+import logging
+import time
+from typing import Any
+
+from switchbee.api.central_unit import CentralUnitAPI
+
+from homeassistant.components.diagnostics import async_redact_data
+
+from .const import CAPTURE_MAX_RECORDS
+
+_LOGGER = logging.getLogger(__name__)
+
+CAPTURE_VERSION = 1
+CAPTURE_CONFIGURATION = "configuration"
+CAPTURE_STATES = "states"
+CAPTURE_PUSH = "push"
+
+# never written to a capture, the Central Unit replies do not carry credentials
+# but a token or user could end up in a push frame
+TO_REDACT = {"token", "user", "username", "pass", "password"}
+
+
+@dataclass
+class CaptureRecord:
+    """A single Central Unit reply or push frame."""
+
+    time: float
+    kind: str
+    data: Any
+
+
+class TrafficCapture:
+    """Record the raw Central Unit replies and pushes of a coordinator.
+
+    Records are kept in memory as JSON lines and written gzipped on save.
+    """
+
+    def __init__(self, path: str, api: CentralUnitAPI) -> None:
+        """Initialize the capture."""
+        self.path = path
+        self._api_type = type(api).__name__
+        self._start = time.monotonic()
+        self._lines: list[str] = []
+
+    def __len__(self) -> int:
+        """Return the number of records."""
+        return len(self._lines)
+
+    def record(self, kind: str, data: Any) -> None:
+        """Add a record, timed from the start of the capture."""
+        if len(self._lines) >= CAPTURE_MAX_RECORDS:
+            if len(self._lines) == CAPTURE_MAX_RECORDS:
+                _LOGGER.warning(
+                    "Capture %s is full, ignoring further traffic", self.path
+                )
+                self._lines.append("")
+            return
+
+        self._lines.append(
+            json.dumps(
+                {
+                    "t": round(time.monotonic() - self._start, 3),
+                    "kind": kind,
+                    "data": async_redact_data(data, TO_REDACT),
+                },
+                separators=(",", ":"),
+            )
+        )
+
+    def save(self) -> None:
+        """Write the capture, must run in the executor."""
+        header = json.dumps({"version": CAPTURE_VERSION, "api": self._api_type})
+        with gzip.open(self.path, "wt", encoding="utf-8") as file:
+            file.write(header + "\n")
+            file.writelines(line + "\n" for line in self._lines if line)
+
+
+def load_capture(path: str) -> list[CaptureRecord]:
+    """Read a capture, must run in the executor."""
+    with gzip.open(path, "rt", encoding="utf-8") as file:
+        header = json.loads(file.readline())
+        if header.get("version") != CAPTURE_VERSION:
+            raise ValueError(f"Unsupported capture version {header.get('version')}")
+
+        return [
+            CaptureRecord(record["t"], record["kind"], record["data"])
+            for record in map(json.loads, file)
+        ]
@@ -1,6 +1,7 @@
 """Support for SwitchBee climate."""
 from __future__ import annotations
 
+from functools import lru_cache
 from typing import Any
 
 from switchbee.api.central_unit import SwitchBeeDeviceOfflineError, SwitchBeeError
@@ -23,8 +24,8 @@ from homeassistant.components.climate import (
     HVACMode,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import ATTR_TEMPERATURE, UnitOfTemperature
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import ATTR_TEMPERATURE, Platform, UnitOfTemperature
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -72,6 +73,12 @@ HVAC_UNIT_SB_TO_HASS = {
 SUPPORTED_FAN_MODES = [FAN_AUTO, FAN_HIGH, FAN_MEDIUM, FAN_LOW]
 
 
+@lru_cache(maxsize=None)
+def _hvac_modes(modes: tuple[str, ...]) -> list[HVACMode]:
+    """Return the HVAC modes list, shared by all thermostats with the same modes."""
+    return [*(HVAC_MODE_SB_TO_HASS[mode] for mode in modes), HVACMode.OFF]
+
+
 async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
@@ -79,8 +86,7 @@ async def async_setup_entry(
     coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
         SwitchBeeClimateEntity(switchbee_device, coordinator)
-        for switchbee_device in coordinator.data.values()
-        if isinstance(switchbee_device, SwitchBeeThermostat)
+        for switchbee_device in coordinator.platform_devices.get(Platform.CLIMATE, [])
     )
 
 
@@ -104,26 +110,32 @@ class SwitchBeeClimateEntity(SwitchBeeDeviceEntity[SwitchBeeThermostat], Climate
         self._attr_max_temp = device.max_temperature
         self._attr_min_temp = device.min_temperature
         self._attr_temperature_unit = HVAC_UNIT_SB_TO_HASS[device.temperature_unit]
-        self._attr_hvac_modes = [HVAC_MODE_SB_TO_HASS[mode] for mode in device.modes]
-        self._attr_hvac_modes.append(HVACMode.OFF)
-        self._update_attrs_from_coordinator()
+        self._attr_hvac_modes = _hvac_modes(tuple(device.modes))
+        # unknown until the state is loaded
+        self._attr_hvac_mode: HVACMode | None = None
+        self._attr_fan_mode = None
+        self._update_from_coordinator()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_attrs_from_coordinator()
-        super()._handle_coordinator_update()
-
-    def _update_attrs_from_coordinator(self) -> None:
+    def _update_from_coordinator(self) -> None:
         coordinator_device = self._get_coordinator_device()
 
-        self._attr_hvac_mode: HVACMode = (
+        # the deferred state was not loaded yet, the next poll reads it
+        if not hasattr(coordinator_device, "temperature"):
+            return
+
+        self._attr_hvac_mode = (
             HVACMode.OFF
             if coordinator_device.state == ApiStateCommand.OFF
             else HVAC_MODE_SB_TO_HASS[coordinator_device.mode]
         )
         self._attr_fan_mode = FAN_SB_TO_HASS[coordinator_device.fan]
-        self._attr_current_temperature = coordinator_device.temperature
+        # the room temperature is only reported once it moved past the deadband
+        if (
+            self._attr_current_temperature is None
+            or abs(coordinator_device.temperature - self._attr_current_temperature)
+            >= self.coordinator.temperature_deadband
+        ):
+            self._attr_current_temperature = coordinator_device.temperature
         self._attr_target_temperature = coordinator_device.target_temperature
 
     async def async_set_hvac_mode(self, hvac_mode: HVACMode) -> None:
@@ -153,6 +165,14 @@ class SwitchBeeClimateEntity(SwitchBeeDeviceEntity[SwitchBeeThermostat], Climate
     ) -> None:
         """Send request to central unit."""
 
+        if (mode is None and self.hvac_mode is None) or (
+            fan is None and self.fan_mode is None
+        ):
+            # the payload carries the full state, it cannot be sent half known
+            raise HomeAssistantError(
+                f"Failed to set {self.name} state, its current state is not loaded yet"
+            )
+
         if power is None:
             power = ApiStateCommand.ON
             if self.hvac_mode == HVACMode.OFF:
@@ -172,7 +192,7 @@ class SwitchBeeClimateEntity(SwitchBeeDeviceEntity[SwitchBeeThermostat], Climate
         }
 
         try:
-            await self.coordinator.api.set_state(self._device.id, state)
+            await self.coordinator.async_set_state(self._device.id, state)
         except (SwitchBeeError, SwitchBeeDeviceOfflineError) as exp:
             raise HomeAssistantError(
                 f"Failed to set {self.name} state {state}, error: {str(exp)}"
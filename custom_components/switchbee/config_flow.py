@@ -10,20 +10,38 @@ import voluptuous as vol
 
 from homeassistant import config_entries
 from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
 import homeassistant.helpers.config_validation as cv
 from homeassistant.helpers.device_registry import format_mac
 
-from .const import DOMAIN
+from .const import (
+    CONF_FAILURE_THRESHOLD,
+    CONF_PROFILING,
+    CONF_READ_RETRIES,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_SECTION_THRESHOLD,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_TEMPERATURE_DEADBAND,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_PROFILING,
+    DEFAULT_READ_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SLOW_SECTION_THRESHOLD,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DOMAIN,
+)
+from .discovery import DiscoveredCentralUnit, async_discover_central_units
 
 _LOGGER = logging.getLogger(__name__)
 
 STEP_USER_DATA_SCHEMA = vol.Schema(
     {
-        vol.Required(CONF_HOST): cv.string,
+        # leave the host empty to search the local network
+        vol.Optional(CONF_HOST): cv.string,
         vol.Required(CONF_USERNAME): cv.string,
         vol.Required(CONF_PASSWORD): cv.string,
     }
@@ -58,6 +76,19 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 2
 
+    def __init__(self) -> None:
+        """Initialize the config flow."""
+        self._credentials: dict[str, Any] = {}
+        self._discovered: dict[str, DiscoveredCentralUnit] = {}
+
+    @staticmethod
+    @callback
+    def async_get_options_flow(
+        config_entry: config_entries.ConfigEntry,
+    ) -> OptionsFlowHandler:
+        """Get the options flow for this handler."""
+        return OptionsFlowHandler(config_entry)
+
     async def async_step_user(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
@@ -69,6 +100,9 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
             )
 
+        if not user_input.get(CONF_HOST):
+            return await self._async_discover(user_input)
+
         try:
             unique_id = await validate_input(self.hass, user_input)
         except CannotConnect:
@@ -88,6 +122,120 @@ class ConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
         )
 
+    async def _async_discover(self, user_input: dict[str, Any]) -> FlowResult:
+        """Search the local network for Central Units not configured yet."""
+        errors: dict[str, str] = {}
+        units, invalid_auth = await async_discover_central_units(
+            self.hass, user_input[CONF_USERNAME], user_input[CONF_PASSWORD]
+        )
+        configured = self._async_current_ids(include_ignore=False)
+        self._discovered = {
+            unit.host: unit for unit in units if unit.unique_id not in configured
+        }
+
+        if self._discovered:
+            self._credentials = user_input
+            return await self.async_step_pick()
+
+        if invalid_auth:
+            errors["base"] = "invalid_auth"
+        elif units:
+            return self.async_abort(reason="already_configured")
+        else:
+            errors["base"] = "no_devices_found"
+
+        return self.async_show_form(
+            step_id="user", data_schema=STEP_USER_DATA_SCHEMA, errors=errors
+        )
+
+    async def async_step_pick(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Let the user pick one of the discovered Central Units."""
+        if user_input is None:
+            return self.async_show_form(
+                step_id="pick",
+                data_schema=vol.Schema(
+                    {
+                        vol.Required(CONF_HOST): vol.In(
+                            {
+                                host: f"{unit.name or unit.unique_id} ({host})"
+                                for host, unit in self._discovered.items()
+                            }
+                        )
+                    }
+                ),
+            )
+
+        unit = self._discovered[user_input[CONF_HOST]]
+        await self.async_set_unique_id(unit.unique_id)
+        self._abort_if_unique_id_configured()
+        return self.async_create_entry(
+            title=unit.host, data={**self._credentials, CONF_HOST: unit.host}
+        )
+
+
+class OptionsFlowHandler(config_entries.OptionsFlow):
+    """Handle SwitchBee options."""
+
+    def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
+        """Initialize options flow."""
+        self.config_entry = config_entry
+
+    async def async_step_init(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage the Central Unit request options."""
+        if user_input is not None:
+            return self.async_create_entry(title="", data=user_input)
+
+        options = self.config_entry.options
+        return self.async_show_form(
+            step_id="init",
+            data_schema=vol.Schema(
+                {
+                    vol.Optional(
+                        CONF_REQUEST_TIMEOUT,
+                        default=options.get(
+                            CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=60)),
+                    vol.Optional(
+                        CONF_READ_RETRIES,
+                        default=options.get(CONF_READ_RETRIES, DEFAULT_READ_RETRIES),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_FAILURE_THRESHOLD,
+                        default=options.get(
+                            CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=20)),
+                    vol.Optional(
+                        CONF_STALE_GRACE_PERIOD,
+                        default=options.get(
+                            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=0, max=3600)),
+                    vol.Optional(
+                        CONF_TEMPERATURE_DEADBAND,
+                        default=options.get(
+                            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+                        ),
+                    ): vol.All(vol.Coerce(float), vol.Range(min=0, max=5)),
+                    vol.Optional(
+                        CONF_PROFILING,
+                        default=options.get(CONF_PROFILING, DEFAULT_PROFILING),
+                    ): bool,
+                    vol.Optional(
+                        CONF_SLOW_SECTION_THRESHOLD,
+                        default=options.get(
+                            CONF_SLOW_SECTION_THRESHOLD, DEFAULT_SLOW_SECTION_THRESHOLD
+                        ),
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1, max=10000)),
+                }
+            ),
+        )
+
 
 class CannotConnect(HomeAssistantError):
     """Error to indicate we cannot connect."""
@@ -1,6 +1,86 @@
 """Constants for the SwitchBee Smart Home integration."""
 
 from switchbee.api import CentralUnitPolling, CentralUnitWsRPC
+from switchbee.device import DeviceType
+
+from homeassistant.const import Platform
 
 DOMAIN = "switchbee"
 SCAN_INTERVAL_SEC = {CentralUnitWsRPC: 10, CentralUnitPolling: 5}
+
+# The platform that represents each supported device type
+DEVICE_TYPE_PLATFORMS: dict[DeviceType, tuple[Platform, ...]] = {
+    DeviceType.Scenario: (Platform.BUTTON,),
+    DeviceType.Thermostat: (Platform.CLIMATE,),
+    DeviceType.VRFAC: (Platform.CLIMATE,),
+    DeviceType.Shutter: (Platform.COVER,),
+    DeviceType.Somfy: (Platform.COVER,),
+    DeviceType.Dimmer: (Platform.LIGHT,),
+    DeviceType.Switch: (Platform.SWITCH,),
+    DeviceType.TimedSwitch: (Platform.SWITCH,),
+    DeviceType.GroupSwitch: (Platform.SWITCH,),
+    DeviceType.TimedPowerSwitch: (Platform.SWITCH, Platform.SENSOR),
+}
+
+# Device types whose state is loaded in the background at startup, after the
+# platforms of the devices users interact with most are set up
+DEFERRED_DEVICE_TYPES = {DeviceType.Thermostat, DeviceType.VRFAC}
+# Platforms set up after that background load, whether it succeeded or not.
+# Scenario buttons have no state to load, they are deferred as rarely used.
+DEFERRED_PLATFORMS = {Platform.CLIMATE, Platform.BUTTON}
+
+ATTR_ZONE = "zone"
+ATTR_STATE = "state"
+ATTR_DEVICE_TYPE = "device_type"
+ATTR_RESET = "reset"
+
+EVENT_MODULE_STATE_CHANGED = f"{DOMAIN}_module_state_changed"
+MODULE_RETRY_MAX_SEC = 300
+# Time given to the Central Unit to run a scenario before reading back its devices
+SCENARIO_SETTLE_SEC = 1
+# Forget a learned scenario member once it did not change on this many runs
+SCENARIO_MEMBER_MAX_MISSES = 3
+SCENARIO_STORAGE_KEY = f"{DOMAIN}.scenario_members"
+SCENARIO_STORAGE_VERSION = 1
+SCENARIO_SAVE_DELAY_SEC = 10
+
+DATA_SESSION_MANAGER = f"{DOMAIN}_session_manager"
+# Log in again this long before the Central Unit token expires
+TOKEN_REFRESH_MARGIN_SEC = 120
+# Close the session of an unloaded entry unless it is set up again within this time
+SESSION_IDLE_RELEASE_SEC = 60
+
+# Traffic captures are written to the config directory
+CAPTURE_SUFFIX = ".jsonl.gz"
+CAPTURE_MAX_RECORDS = 100_000
+
+CONF_REQUEST_TIMEOUT = "request_timeout"
+CONF_READ_RETRIES = "read_retries"
+CONF_FAILURE_THRESHOLD = "failure_threshold"
+CONF_STALE_GRACE_PERIOD = "stale_grace_period"
+CONF_TEMPERATURE_DEADBAND = "temperature_deadband"
+CONF_PROFILING = "profiling"
+CONF_SLOW_SECTION_THRESHOLD = "slow_section_threshold"
+DEFAULT_REQUEST_TIMEOUT = 10
+DEFAULT_READ_RETRIES = 2
+DEFAULT_FAILURE_THRESHOLD = 3
+DEFAULT_STALE_GRACE_PERIOD = 60
+DEFAULT_TEMPERATURE_DEADBAND = 0.0
+DEFAULT_PROFILING = False
+# milliseconds
+DEFAULT_SLOW_SECTION_THRESHOLD = 50
+# How long an unresponsive Central Unit is left alone before probing it again
+CIRCUIT_RESET_SEC = 15
+
+ATTR_STALE_SINCE = "stale_since"
+# Reported minutes left only move the timer end once it is off by more than this
+TIMER_DRIFT_SEC = 90
+
+# Central Unit discovery, the polling API is served over HTTPS
+DISCOVERY_PORT = 443
+DISCOVERY_MAX_PARALLEL = 64
+DISCOVERY_CONNECT_TIMEOUT_SEC = 1
+DISCOVERY_PROBE_TIMEOUT_SEC = 3
+DISCOVERY_LOGIN_TIMEOUT_SEC = 5
+# never scan more than a /24 around each local address
+DISCOVERY_MIN_PREFIX = 24
@@ -2,22 +2,162 @@
 
 from __future__ import annotations
 
-from collections.abc import Mapping
-from datetime import timedelta
+import asyncio
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from functools import partial
 import logging
+import time
+from typing import Any
 
+from switchbee import SWITCHBEE_BRAND
 from switchbee.api import CentralUnitPolling, CentralUnitWsRPC
 from switchbee.api.central_unit import SwitchBeeError
-from switchbee.device import DeviceType, SwitchBeeBaseDevice
+from switchbee.const import ApiAttribute
+from switchbee.device import (
+    ApiStateCommand,
+    DeviceType,
+    HardwareType,
+    SwitchBeeBaseDevice,
+    SwitchBeeDimmer,
+    SwitchBeeGroupSwitch,
+    SwitchBeeShutter,
+    SwitchBeeSwitch,
+    SwitchBeeTimedSwitch,
+    SwitchBeeTimerSwitch,
+)
 
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.device_registry import format_mac
+from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.helpers.storage import Store
 from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
 
-from .const import DOMAIN, SCAN_INTERVAL_SEC
+from .const import (
+    CAPTURE_SUFFIX,
+    CIRCUIT_RESET_SEC,
+    CONF_FAILURE_THRESHOLD,
+    CONF_PROFILING,
+    CONF_READ_RETRIES,
+    CONF_REQUEST_TIMEOUT,
+    CONF_SLOW_SECTION_THRESHOLD,
+    CONF_STALE_GRACE_PERIOD,
+    CONF_TEMPERATURE_DEADBAND,
+    DEFAULT_FAILURE_THRESHOLD,
+    DEFAULT_PROFILING,
+    DEFAULT_READ_RETRIES,
+    DEFAULT_REQUEST_TIMEOUT,
+    DEFAULT_SLOW_SECTION_THRESHOLD,
+    DEFAULT_STALE_GRACE_PERIOD,
+    DEFAULT_TEMPERATURE_DEADBAND,
+    DEFERRED_DEVICE_TYPES,
+    DEFERRED_PLATFORMS,
+    DEVICE_TYPE_PLATFORMS,
+    DOMAIN,
+    EVENT_MODULE_STATE_CHANGED,
+    MODULE_RETRY_MAX_SEC,
+    SCAN_INTERVAL_SEC,
+    SCENARIO_MEMBER_MAX_MISSES,
+    SCENARIO_SAVE_DELAY_SEC,
+    SCENARIO_SETTLE_SEC,
+    SCENARIO_STORAGE_KEY,
+    SCENARIO_STORAGE_VERSION,
+)
+from .capture import (
+    CAPTURE_CONFIGURATION,
+    CAPTURE_PUSH,
+    CAPTURE_STATES,
+    TrafficCapture,
+)
+from .profiler import SwitchBeeProfiler
+from .resilience import CircuitBreaker, RequestPolicy
 
 _LOGGER = logging.getLogger(__name__)
 
+# Device types the Central Unit reports a state for
+STATEFUL_DEVICE_TYPES = {
+    DeviceType.Switch,
+    DeviceType.GroupSwitch,
+    DeviceType.Dimmer,
+    DeviceType.Shutter,
+    DeviceType.TimedPowerSwitch,
+    DeviceType.Thermostat,
+    DeviceType.TimedSwitch,
+    DeviceType.VRFAC,
+}
+
+
+# Device attributes making up its state, see _device_state
+_STATE_ATTRIBUTES = (
+    "state",
+    "brightness",
+    "position",
+    "mode",
+    "fan",
+    "target_temperature",
+)
+
+# Decode a raw state straight into the device, the library setter of the simple
+# device types, any other type goes through the generic update_device_state
+_STATE_SETTERS: dict[type[SwitchBeeBaseDevice], Callable[[Any, Any], None]] = {
+    SwitchBeeDimmer: SwitchBeeDimmer.brightness.fset,
+    SwitchBeeShutter: SwitchBeeShutter.position.fset,
+    SwitchBeeSwitch: SwitchBeeSwitch.state.fset,
+    SwitchBeeGroupSwitch: SwitchBeeGroupSwitch.state.fset,
+    SwitchBeeTimedSwitch: SwitchBeeTimedSwitch.state.fset,
+    SwitchBeeTimerSwitch: SwitchBeeTimerSwitch.state.fset,
+}
+
+_UNKNOWN = object()
+
+
+def _is_pollable(device: SwitchBeeBaseDevice) -> bool:
+    """Return True if the Central Unit can report the state of the device."""
+    return device.type in STATEFUL_DEVICE_TYPES and (
+        device.hardware != HardwareType.Virtual or device.type == DeviceType.VRFAC
+    )
+
+
+def _is_offline(device: SwitchBeeBaseDevice) -> bool | None:
+    """Return True if the device is reported offline, None if it has no state yet."""
+    if isinstance(device, SwitchBeeDimmer):
+        value = getattr(device, "brightness", None)
+    elif isinstance(device, SwitchBeeShutter):
+        value = device.position
+    elif isinstance(device, SwitchBeeTimerSwitch):
+        value = getattr(device, "minutes_left", None)
+    else:
+        value = getattr(device, "state", None)
+
+    if value is None:
+        return None
+
+    return value == -1
+
+
+def scenario_members_store(
+    hass: HomeAssistant, entry_id: str
+) -> Store[dict[str, dict[str, int]]]:
+    """Return the store of the learned scenario members of a config entry."""
+    return Store(hass, SCENARIO_STORAGE_VERSION, f"{SCENARIO_STORAGE_KEY}.{entry_id}")
+
+
+def _device_state(device: SwitchBeeBaseDevice) -> tuple:
+    """Return the comparable state of a device."""
+    return tuple(getattr(device, attr, None) for attr in _STATE_ATTRIBUTES)
+
+
+@dataclass
+class ModuleHealth:
+    """Health of an offline module."""
+
+    failures: int = 0
+    next_retry: float = 0.0
+
 
 class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevice]]):
     """Class to manage fetching SwitchBee data API."""
@@ -26,9 +166,24 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
         self,
         hass: HomeAssistant,
         swb_api: CentralUnitPolling | CentralUnitWsRPC,
+        options: Mapping[str, Any],
     ) -> None:
         """Initialize."""
         self.api: CentralUnitPolling | CentralUnitWsRPC = swb_api
+        self.profiler = SwitchBeeProfiler(
+            options.get(CONF_PROFILING, DEFAULT_PROFILING),
+            options.get(CONF_SLOW_SECTION_THRESHOLD, DEFAULT_SLOW_SECTION_THRESHOLD)
+            / 1000,
+        )
+        self.policy = RequestPolicy(
+            options.get(CONF_REQUEST_TIMEOUT, DEFAULT_REQUEST_TIMEOUT),
+            options.get(CONF_READ_RETRIES, DEFAULT_READ_RETRIES),
+            CircuitBreaker(
+                options.get(CONF_FAILURE_THRESHOLD, DEFAULT_FAILURE_THRESHOLD),
+                CIRCUIT_RESET_SEC,
+            ),
+            self.profiler,
+        )
         self._reconnect_counts: int = 0
         assert self.api.mac is not None
         self.unique_id = (
@@ -36,11 +191,52 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
             if self.api.unique_id is not None
             else format_mac(self.api.mac)
         )
+        # zone name -> device ids and module (unit_id) -> device ids
+        self.zones: dict[str, list[int]] = {}
+        self.modules: dict[int, list[int]] = {}
+        self.offline_modules: dict[int, ModuleHealth] = {}
+        # devices classified once per platform, and the platforms forwarded
+        self.platform_devices: dict[Platform, list[SwitchBeeBaseDevice]] = {}
+        self.loaded_platforms: set[Platform] = set()
+        self._module_displays: dict[int, str] = {}
+        self._device_infos: dict[str, DeviceInfo] = {}
+        self._via_device: tuple[str, str] | None = None
+        # scenario id -> ids of the devices it was seen changing, with the number
+        # of runs since they last changed
+        self.scenario_members: dict[int, dict[int, int]] = {}
+        self._scenario_store: Store[dict[str, dict[str, int]]] | None = None
+        # keep serving the last good states for this long when polling fails
+        self.stale_grace_period: int = options.get(
+            CONF_STALE_GRACE_PERIOD, DEFAULT_STALE_GRACE_PERIOD
+        )
+        self.stale_since: datetime | None = None
+        # last raw state and precompiled decoder of each device, and the devices
+        # changed by the last update (None when all entities should update)
+        self._raw_states: dict[int, Any] = {}
+        self._decoders: dict[int, Callable[[Any], None]] = {}
+        self._changed_device_ids: set[int] | None = None
+        # devices whose first state is loaded after startup, see DEFERRED_DEVICE_TYPES,
+        # and the background task loading them and setting up DEFERRED_PLATFORMS
+        self._deferred_device_ids: set[int] = set()
+        self.deferred_platforms_pending = True
+        self.deferred_setup: asyncio.Task[None] | None = None
+        # raw Central Unit traffic is recorded while capturing
+        self.capture: TrafficCapture | None = None
+        # climate entities keep the last written room temperature until it
+        # moved by at least this much
+        self.temperature_deadband: float = options.get(
+            CONF_TEMPERATURE_DEADBAND, DEFAULT_TEMPERATURE_DEADBAND
+        )
+        self._scan_interval = next(
+            interval
+            for api_type, interval in SCAN_INTERVAL_SEC.items()
+            if isinstance(self.api, api_type)
+        )
         super().__init__(
             hass,
             _LOGGER,
             name=DOMAIN,
-            update_interval=timedelta(seconds=SCAN_INTERVAL_SEC[type(self.api)]),
+            update_interval=timedelta(seconds=self._scan_interval),
         )
 
         # Register callback for notification WsRPC
@@ -51,11 +247,450 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
     def _async_handle_update(self, push_data: dict) -> None:
         """Manually update data and notify listeners."""
         assert isinstance(self.api, CentralUnitWsRPC)
-        _LOGGER.debug("Received update: %s", push_data)
+        with self.profiler.measure("_async_handle_update"):
+            _LOGGER.debug("Received update: %s", push_data)
+            if self.capture is not None:
+                self.capture.record(CAPTURE_PUSH, push_data)
+            changed: set[int] = set()
+            if (device_id := push_data.get(ApiAttribute.ID)) in self.api.devices:
+                # the library already applied the push, keep the raw state in sync
+                self._raw_states[device_id] = push_data.get(ApiAttribute.NEW_VALUE)
+                changed.add(device_id)
+                changed |= self._update_module_availability(
+                    {self.api.devices[device_id].unit_id}
+                )
+            self._async_set_changed_data(changed)
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates, timing the listener when profiling."""
+        if self.profiler.enabled:
+            update_callback = self.profiler.wrap(update_callback)
+        return super().async_add_listener(update_callback, context)
+
+    @callback
+    def _async_set_changed_data(self, changed: set[int]) -> None:
+        """Notify the listeners of the devices that changed."""
+        # entities of all devices become available again after a failed update
+        self._changed_device_ids = changed if self.last_update_success else None
         self.async_set_updated_data(self.api.devices)
 
+    @callback
+    def async_set_device_state(self, device_id: int, raw_state: Any) -> None:
+        """Apply the state a command set on a device and notify its listeners."""
+        if self._raw_states.get(device_id, _UNKNOWN) == raw_state:
+            return
+
+        self._raw_states[device_id] = raw_state
+        self._decoders[device_id](raw_state)
+        self._async_set_changed_data({device_id})
+
+    def device_changed(self, device_id: int) -> bool:
+        """Return True if the device state or availability changed in the last update."""
+        return self._changed_device_ids is None or device_id in self._changed_device_ids
+
+    def _apply_states(self, states: Mapping[str, Any]) -> set[int]:
+        """Decode a state reply, skipping the devices whose raw state is unchanged."""
+        changed = set()
+        raw_states = self._raw_states
+        decoders = self._decoders
+        for device_state in states.get(ApiAttribute.DATA, []):
+            device_id = device_state[ApiAttribute.ID]
+            raw_state = device_state[ApiAttribute.STATE]
+            if (decode := decoders.get(device_id)) is None or raw_states.get(
+                device_id, _UNKNOWN
+            ) == raw_state:
+                continue
+
+            raw_states[device_id] = raw_state
+            decode(raw_state)
+            changed.add(device_id)
+
+        if self._deferred_device_ids:
+            self._deferred_device_ids.difference_update(
+                device_state[ApiAttribute.ID]
+                for device_state in states.get(ApiAttribute.DATA, [])
+            )
+
+        return changed
+
+    @property
+    def platforms(self) -> set[Platform]:
+        """Return the platforms having devices, once the deferred ones may load."""
+        if self.deferred_platforms_pending:
+            return set(self.platform_devices) - DEFERRED_PLATFORMS
+        return set(self.platform_devices)
+
+    async def async_load_deferred_devices(self) -> None:
+        """Load the states of the devices deferred at startup.
+
+        Their platforms are released afterwards in any case, devices the
+        Central Unit did not report are loaded by the regular polls.
+        """
+        if self._deferred_device_ids:
+            try:
+                await self.async_refresh_devices(list(self._deferred_device_ids))
+            except HomeAssistantError as exp:
+                _LOGGER.warning("Failed to load the deferred devices: %s", exp)
+            else:
+                if self._deferred_device_ids:
+                    _LOGGER.warning(
+                        "The Central Unit did not report the state of devices %s",
+                        sorted(self._deferred_device_ids),
+                    )
+
+        self._deferred_device_ids.clear()
+        self.deferred_platforms_pending = False
+
+    def _build_indexes(self) -> None:
+        """Index the loaded devices by zone, module and platform in a single pass."""
+        with self.profiler.measure("_build_indexes"):
+            self.zones.clear()
+            self.modules.clear()
+            self.platform_devices.clear()
+            self._module_displays.clear()
+            self._device_infos.clear()
+            self._via_device = None
+            self._raw_states.clear()
+            self._decoders.clear()
+            for device in self.api.devices.values():
+                self.zones.setdefault(device.zone, []).append(device.id)
+                self.modules.setdefault(device.unit_id, []).append(device.id)
+                for platform in DEVICE_TYPE_PLATFORMS.get(device.type, ()):
+                    self.platform_devices.setdefault(platform, []).append(device)
+                if (setter := _STATE_SETTERS.get(type(device))) is not None:
+                    self._decoders[device.id] = partial(setter, device)
+                else:
+                    self._decoders[device.id] = partial(
+                        self.api.update_device_state, device.id
+                    )
+
+    def module_display(self, unit_id: int) -> str:
+        """Return the (cached) display name of a module."""
+        if (display := self._module_displays.get(unit_id)) is None:
+            display = self._module_displays[unit_id] = self.api.module_display(unit_id)
+        return display
+
+    def device_info(self, device: SwitchBeeBaseDevice) -> DeviceInfo:
+        """Return the DeviceInfo shared by all entities of a module (or thermostat)."""
+        if self._via_device is None:
+            self._via_device = (DOMAIN, f"{self.api.name} ({self.api.unique_id})")
+
+        identifier = (
+            device.id if device.type == DeviceType.Thermostat else device.unit_id
+        )
+        key = f"{identifier}-{self.unique_id}"
+        if (device_info := self._device_infos.get(key)) is None:
+            device_info = self._device_infos[key] = DeviceInfo(
+                name=device.zone,
+                identifiers={(DOMAIN, key)},
+                manufacturer=SWITCHBEE_BRAND,
+                model=self.module_display(device.unit_id),
+                suggested_area=device.zone,
+                via_device=self._via_device,
+            )
+        return device_info
+
+    def _update_module_availability(self, unit_ids: Iterable[int]) -> set[int]:
+        """Track module health, a module is offline once all its reporting devices are.
+
+        Returns the devices of the modules that went offline or came back.
+        """
+        changed: set[int] = set()
+        now = time.monotonic()
+        for unit_id in unit_ids:
+            reports = [
+                offline
+                for device_id in self.modules.get(unit_id, [])
+                if (offline := _is_offline(self.api.devices[device_id])) is not None
+            ]
+            if not reports:
+                continue
+
+            if all(reports):
+                if (health := self.offline_modules.get(unit_id)) is None:
+                    health = self.offline_modules[unit_id] = ModuleHealth()
+                    self._async_fire_module_event(unit_id, online=False)
+                    changed.update(self.modules[unit_id])
+                # back off exponentially while the module keeps failing
+                health.next_retry = now + min(
+                    self._scan_interval * 2**health.failures, MODULE_RETRY_MAX_SEC
+                )
+                health.failures += 1
+            elif self.offline_modules.pop(unit_id, None) is not None:
+                self._async_fire_module_event(unit_id, online=True)
+                changed.update(self.modules[unit_id])
+
+        return changed
+
+    @callback
+    def _async_fire_module_event(self, unit_id: int, online: bool) -> None:
+        """Log and fire a single event for a module going offline or back online."""
+        if online:
+            _LOGGER.info("Module %s is now responding", unit_id)
+        else:
+            _LOGGER.warning(
+                (
+                    "Module %s (%s) is not responding, check the status in"
+                    " the SwitchBee mobile app"
+                ),
+                unit_id,
+                self.module_display(unit_id),
+            )
+
+        self.hass.bus.async_fire(
+            EVENT_MODULE_STATE_CHANGED,
+            {
+                "central_unit": self.unique_id,
+                "unit_id": unit_id,
+                "module": self.module_display(unit_id),
+                "devices": list(self.modules[unit_id]),
+                "online": online,
+            },
+        )
+
+    def _pollable_device_ids(self) -> list[int]:
+        """Return the devices to poll, skipping offline modules not yet due for a retry."""
+        now = time.monotonic()
+        return [
+            device.id
+            for device in self.api.devices.values()
+            if _is_pollable(device)
+            and (
+                (health := self.offline_modules.get(device.unit_id)) is None
+                or health.next_retry <= now
+            )
+        ]
+
+    def is_module_online(self, unit_id: int) -> bool:
+        """Return True unless the module hosting the device is offline."""
+        return unit_id not in self.offline_modules
+
+    async def async_set_state(
+        self, device_id: int, state: str | int | dict[str, int | str]
+    ) -> None:
+        """Send a command to a device within the request policy."""
+        await self.policy.async_command(self.api.set_state, device_id, state)
+
+    async def async_refresh_devices(self, device_ids: Iterable[int]) -> None:
+        """Fetch the state of the given devices in one request and notify listeners."""
+        devices = [
+            device
+            for device_id in device_ids
+            if (device := self.api.devices.get(device_id)) and _is_pollable(device)
+        ]
+        if not devices:
+            return
+
+        try:
+            states = await self.policy.async_read(
+                self.api.get_multiple_states, [device.id for device in devices]
+            )
+        except SwitchBeeError as exp:
+            raise HomeAssistantError(
+                f"Failed to fetch the state of {len(devices)} devices, {str(exp)}"
+            ) from exp
+
+        if self.capture is not None:
+            self.capture.record(CAPTURE_STATES, states)
+
+        changed = self._apply_states(states)
+        changed |= self._update_module_availability(
+            {device.unit_id for device in devices}
+        )
+        self._async_set_changed_data(changed)
+
+    async def async_fire_scenario(self, scenario_id: int) -> None:
+        """Fire a scenario and read back the devices it changes shortly after."""
+        before = {
+            device.id: _device_state(device)
+            for device in self.api.devices.values()
+            if _is_pollable(device)
+        }
+        await self.async_set_state(scenario_id, ApiStateCommand.ON)
+        coroutine = self._async_follow_up_scenario(scenario_id, before)
+        if self.config_entry is not None:
+            self.config_entry.async_create_background_task(
+                self.hass, coroutine, f"{DOMAIN} scenario {scenario_id} follow-up"
+            )
+        else:
+            self.hass.async_create_background_task(
+                coroutine, f"{DOMAIN} scenario {scenario_id} follow-up"
+            )
+
+    async def _async_follow_up_scenario(
+        self, scenario_id: int, before: dict[int, tuple]
+    ) -> None:
+        """Refresh the scenario members, learning them from the changed states."""
+        await asyncio.sleep(SCENARIO_SETTLE_SEC)
+        members = self.scenario_members.get(scenario_id, {})
+        try:
+            # until the members are known, read all devices back once
+            await self.async_refresh_devices(members or before)
+        except HomeAssistantError as exp:
+            _LOGGER.debug("Failed to refresh scenario %s devices: %s", scenario_id, exp)
+            return
+
+        changed = {
+            device_id
+            for device_id, state in before.items()
+            if _device_state(self.api.devices[device_id]) != state
+        }
+        # members already in the target state do not change, forget them only
+        # after missing a few runs in a row
+        learned = {
+            device_id: 0 if device_id in changed else misses + 1
+            for device_id, misses in members.items()
+            if device_id in changed or misses + 1 < SCENARIO_MEMBER_MAX_MISSES
+        }
+        learned.update(dict.fromkeys(changed, 0))
+        if learned.keys() != members.keys():
+            _LOGGER.debug(
+                "Scenario %s changes %s", scenario_id, sorted(learned) or "nothing"
+            )
+        if learned:
+            self.scenario_members[scenario_id] = learned
+        else:
+            self.scenario_members.pop(scenario_id, None)
+        self._async_save_scenario_members()
+
+    async def async_load_scenario_members(self) -> None:
+        """Load the scenario members learned before a restart."""
+        if self.config_entry is None:
+            return
+
+        self._scenario_store = scenario_members_store(
+            self.hass, self.config_entry.entry_id
+        )
+        if (stored := await self._scenario_store.async_load()) is None:
+            return
+
+        self.scenario_members = {
+            int(scenario_id): {
+                int(device_id): misses for device_id, misses in members.items()
+            }
+            for scenario_id, members in stored.items()
+        }
+
+    @callback
+    def _async_save_scenario_members(self) -> None:
+        """Save the learned scenario members, batching close runs."""
+        if self._scenario_store is None:
+            return
+
+        self._scenario_store.async_delay_save(
+            lambda: {
+                str(scenario_id): {
+                    str(device_id): misses for device_id, misses in members.items()
+                }
+                for scenario_id, members in self.scenario_members.items()
+            },
+            SCENARIO_SAVE_DELAY_SEC,
+        )
+
+    async def async_start_capture(self) -> None:
+        """Start recording the Central Unit traffic, from a fresh configuration."""
+        if self.capture is not None:
+            return
+
+        try:
+            configuration = await self.policy.async_read(self.api.get_configuration)
+        except SwitchBeeError as exp:
+            raise HomeAssistantError(
+                f"Failed to read the Central Unit configuration, {str(exp)}"
+            ) from exp
+
+        self.capture = TrafficCapture(
+            self.hass.config.path(
+                f"{DOMAIN}_{self.unique_id}_{dt_util.utcnow():%Y%m%d%H%M%S}"
+                f"{CAPTURE_SUFFIX}"
+            ),
+            self.api,
+        )
+        self.capture.record(CAPTURE_CONFIGURATION, configuration)
+        _LOGGER.info("Capturing the Central Unit traffic to %s", self.capture.path)
+
+    async def async_stop_capture(self) -> None:
+        """Stop recording and write the capture."""
+        if (capture := self.capture) is None:
+            return
+
+        self.capture = None
+        await self.hass.async_add_executor_job(capture.save)
+        _LOGGER.info("Saved %i Central Unit records to %s", len(capture), capture.path)
+
+    async def async_refresh_zone(self, zone: str) -> None:
+        """Fetch the state of all devices in a zone."""
+        await self.async_refresh_devices(self.zones.get(zone, []))
+
+    async def async_set_zone_state(
+        self,
+        zone: str,
+        state: str | int,
+        device_types: Iterable[DeviceType] | None = None,
+    ) -> None:
+        """Send the same state to all (matching) devices in a zone at once."""
+        types = set(device_types) if device_types is not None else None
+        device_ids = [
+            device_id
+            for device_id in self.zones.get(zone, [])
+            if types is None or self.api.devices[device_id].type in types
+        ]
+        if not device_ids:
+            return
+
+        results = await asyncio.gather(
+            *(
+                self.policy.async_command(self.api.set_state, device_id, state)
+                for device_id in device_ids
+            ),
+            return_exceptions=True,
+        )
+
+        # read back the zone in a single request, whether or not all commands succeeded
+        await self.async_refresh_devices(device_ids)
+
+        if failed := [
+            self.api.devices[device_id].name
+            for device_id, result in zip(device_ids, results)
+            if isinstance(result, Exception)
+        ]:
+            raise HomeAssistantError(
+                f"Failed to set {zone} devices {', '.join(failed)} state {state}"
+            )
+
     async def _async_update_data(self) -> Mapping[int, SwitchBeeBaseDevice]:
-        """Update data via library."""
+        """Update data via library, serving the last good data during short outages."""
+        # a failed update notifies all entities
+        self._changed_device_ids = None
+        try:
+            with self.profiler.measure("_async_update_data", blocking=False):
+                data = await self._async_fetch_data()
+        except UpdateFailed as exp:
+            if self.data is None or self.stale_grace_period <= 0:
+                raise
+
+            now = dt_util.utcnow()
+            if self.stale_since is None:
+                self.stale_since = now
+                _LOGGER.debug("Serving last known states, revalidating: %s", exp)
+            elif (now - self.stale_since).total_seconds() >= self.stale_grace_period:
+                raise
+
+            return self.api.devices
+
+        if self.stale_since is not None or not self.last_update_success:
+            self._changed_device_ids = None
+        if self.stale_since is not None:
+            _LOGGER.debug("Central Unit states are up to date again")
+            self.stale_since = None
+
+        return data
+
+    async def _async_fetch_data(self) -> Mapping[int, SwitchBeeBaseDevice]:
+        """Fetch the devices and their states from the Central Unit."""
 
         if self._reconnect_counts != self.api.reconnect_count:
             self._reconnect_counts = self.api.reconnect_count
@@ -64,11 +699,13 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
                 self._reconnect_counts,
             )
 
-        # The devices are loaded once during the config_entry
-        if not self.api.devices:
-            # Try to load the devices from the CU for the first time
+        # The devices are loaded once per config entry setup, the API object
+        # (and its devices) outlives reloads, see SwitchBeeSessionManager
+        if self.data is None or not self.api.devices:
+            # Try to load the devices from the CU
             try:
-                await self.api.fetch_configuration(
+                await self.policy.async_read(
+                    self.api.fetch_configuration,
                     [
                         DeviceType.Switch,
                         DeviceType.TimedSwitch,
@@ -80,7 +717,7 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
                         DeviceType.Somfy,
                         DeviceType.Thermostat,
                         DeviceType.VRFAC,
-                    ]
+                    ],
                 )
             except SwitchBeeError as exp:
                 raise UpdateFailed(
@@ -88,13 +725,43 @@ class SwitchBeeCoordinator(DataUpdateCoordinator[Mapping[int, SwitchBeeBaseDevic
                 ) from SwitchBeeError
 
             _LOGGER.debug("Loaded devices")
+            self._build_indexes()
 
-        # Get the state of the devices
+        if not self.modules:
+            self._build_indexes()
+
+        # Get the state of the devices, offline modules are polled with a backoff
+        device_ids = self._pollable_device_ids()
+        if self.data is None:
+            # at startup only load the devices users interact with, the others
+            # are loaded in the background once their platforms may wait
+            self._deferred_device_ids = {
+                device_id
+                for device_id in device_ids
+                if self.api.devices[device_id].type in DEFERRED_DEVICE_TYPES
+            }
+            device_ids = [
+                device_id
+                for device_id in device_ids
+                if device_id not in self._deferred_device_ids
+            ]
         try:
-            await self.api.fetch_states()
+            states = await self.policy.async_read(
+                self.api.get_multiple_states, device_ids
+            )
         except SwitchBeeError as exp:
             raise UpdateFailed(
                 f"Error communicating with API: {exp}"
             ) from SwitchBeeError
 
-        return self.api.devices
\ No newline at end of file
+        if self.capture is not None:
+            self.capture.record(CAPTURE_STATES, states)
+
+        with self.profiler.measure("_async_fetch_data.apply_states"):
+            changed = self._apply_states(states)
+            changed |= self._update_module_availability(
+                {self.api.devices[device_id].unit_id for device_id in device_ids}
+            )
+
+        self._changed_device_ids = changed
+        return self.api.devices
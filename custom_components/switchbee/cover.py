@@ -15,7 +15,8 @@ from homeassistant.components.cover import (
     CoverEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -31,7 +32,7 @@ async def async_setup_entry(
     coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
     entities: list[CoverEntity] = []
 
-    for device in coordinator.data.values():
+    for device in coordinator.platform_devices.get(Platform.COVER, []):
         if isinstance(device, SwitchBeeShutter):
             entities.append(SwitchBeeCoverEntity(device, coordinator))
         elif isinstance(device, SwitchBeeSomfy):
@@ -52,7 +53,7 @@ class SwitchBeeSomfyEntity(SwitchBeeDeviceEntity[SwitchBeeSomfy], CoverEntity):
     async def _fire_somfy_command(self, command: str) -> None:
         """Async function to fire Somfy device command."""
         try:
-            await self.coordinator.api.set_state(self._device.id, command)
+            await self.coordinator.async_set_state(self._device.id, command)
         except (SwitchBeeError, SwitchBeeTokenError) as exp:
             raise HomeAssistantError(
                 f"Failed to fire {command} for {self.name}, {str(exp)}"
@@ -83,31 +84,20 @@ class SwitchBeeCoverEntity(SwitchBeeDeviceEntity[SwitchBeeShutter], CoverEntity)
     )
     _attr_is_closed: bool | None = None
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_from_coordinator()
-        super()._handle_coordinator_update()
-
     def _update_from_coordinator(self) -> None:
         """Update the entity attributes from the coordinator data."""
 
         coordinator_device = self._get_coordinator_device()
 
         if coordinator_device.position == -1:
-            self._check_if_became_offline()
             return
 
-        # check if the device was offline (now online) and bring it back
-        self._check_if_became_online()
-
         self._attr_current_cover_position = coordinator_device.position
 
         if self.current_cover_position == 0:
             self._attr_is_closed = True
         else:
             self._attr_is_closed = False
-        super()._handle_coordinator_update()
 
     async def async_open_cover(self, **kwargs: Any) -> None:
         """Open the cover."""
@@ -141,13 +131,14 @@ class SwitchBeeCoverEntity(SwitchBeeDeviceEntity[SwitchBeeShutter], CoverEntity)
         ):
             return
         try:
-            await self.coordinator.api.set_state(self._device.id, kwargs[ATTR_POSITION])
+            await self.coordinator.async_set_state(
+                self._device.id, kwargs[ATTR_POSITION]
+            )
         except (SwitchBeeError, SwitchBeeTokenError) as exp:
             raise HomeAssistantError(
                 f"Failed to set {self.name} position to {kwargs[ATTR_POSITION]}, error:"
                 f" {str(exp)}"
             ) from exp
 
-        self._get_coordinator_device().position = kwargs[ATTR_POSITION]
-        self.coordinator.async_set_updated_data(self.coordinator.data)
+        self.coordinator.async_set_device_state(self._device.id, kwargs[ATTR_POSITION])
         self.async_write_ha_state()
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Diagnostics support for the SwitchBee Smart Home integration."""
+
+from __future__ import annotations
+
+from typing import Any
+
+from homeassistant.components.diagnostics import async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+
+from .const import DOMAIN
+from .coordinator import SwitchBeeCoordinator
+
+TO_REDACT = {CONF_PASSWORD, CONF_USERNAME}
+
+
+async def async_get_config_entry_diagnostics(
+    hass: HomeAssistant, entry: ConfigEntry
+) -> dict[str, Any]:
+    """Return diagnostics for a config entry."""
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
+
+    return {
+        "entry": {
+            "data": async_redact_data(entry.data, TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "central_unit": {
+            "name": coordinator.api.name,
+            "version": str(coordinator.api.version),
+            "api": type(coordinator.api).__name__,
+            "devices": len(coordinator.api.devices),
+            "reconnect_count": coordinator.api.reconnect_count,
+        },
+        "platforms": {
+            platform: len(devices)
+            for platform, devices in coordinator.platform_devices.items()
+        },
+        "offline_modules": sorted(coordinator.offline_modules),
+        "circuit_open": coordinator.policy.breaker.is_open,
+        "stale_since": coordinator.stale_since,
+        "profile": coordinator.profiler.summary(),
+    }
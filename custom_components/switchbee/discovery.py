@@ -0,0 +1,181 @@
+"""Local network discovery of SwitchBee Central Units."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass
+import ipaddress
+import logging
+from typing import TypeVar
+
+from aiohttp import ClientError, ClientSession
+import async_timeout
+from switchbee.api.central_unit import SwitchBeeError
+from switchbee.api.polling import CentralUnitPolling
+from switchbee.const import ApiAttribute, ApiCommand, ApiStatus
+
+from homeassistant.components import network
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.device_registry import format_mac
+
+from .const import (
+    DISCOVERY_CONNECT_TIMEOUT_SEC,
+    DISCOVERY_LOGIN_TIMEOUT_SEC,
+    DISCOVERY_MAX_PARALLEL,
+    DISCOVERY_MIN_PREFIX,
+    DISCOVERY_PORT,
+    DISCOVERY_PROBE_TIMEOUT_SEC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+_R = TypeVar("_R")
+
+
+@dataclass
+class DiscoveredCentralUnit:
+    """A Central Unit found on the local network."""
+
+    host: str
+    unique_id: str
+    name: str | None
+
+
+async def _async_local_hosts(hass: HomeAssistant) -> list[str]:
+    """Return the addresses of the local IPv4 subnets, at most a /24 each."""
+    hosts: set[str] = set()
+    for adapter in await network.async_get_adapters(hass):
+        if not adapter["enabled"]:
+            continue
+        for ipv4 in adapter["ipv4"]:
+            prefix = max(ipv4["network_prefix"], DISCOVERY_MIN_PREFIX)
+            subnet = ipaddress.ip_network(f"{ipv4['address']}/{prefix}", strict=False)
+            if subnet.is_loopback or subnet.is_link_local:
+                continue
+            hosts.update(
+                str(host) for host in subnet.hosts() if str(host) != ipv4["address"]
+            )
+
+    return sorted(hosts, key=ipaddress.IPv4Address)
+
+
+async def _async_gather_bounded(
+    items: Iterable[_T], func: Callable[[_T], Awaitable[_R]]
+) -> list[_R]:
+    """Run func for all items, at most DISCOVERY_MAX_PARALLEL at a time."""
+    semaphore = asyncio.Semaphore(DISCOVERY_MAX_PARALLEL)
+
+    async def _async_bounded(item: _T) -> _R:
+        async with semaphore:
+            return await func(item)
+
+    return await asyncio.gather(*(_async_bounded(item) for item in items))
+
+
+async def _async_port_open(host: str) -> bool:
+    """Return True if the Central Unit API port accepts connections."""
+    try:
+        async with async_timeout.timeout(DISCOVERY_CONNECT_TIMEOUT_SEC):
+            _, writer = await asyncio.open_connection(host, DISCOVERY_PORT)
+    except (OSError, asyncio.TimeoutError):
+        return False
+
+    writer.close()
+    return True
+
+
+async def _async_is_central_unit(websession: ClientSession, host: str) -> bool:
+    """Return True if the host answers a command like a Central Unit.
+
+    The command is sent without a token or credentials, a Central Unit rejects
+    it with its JSON status reply. Only hosts passing this are logged in to.
+    """
+    try:
+        async with async_timeout.timeout(DISCOVERY_PROBE_TIMEOUT_SEC):
+            async with websession.post(
+                url=f"https://{host}:{DISCOVERY_PORT}/commands",
+                json={ApiAttribute.COMMAND: ApiCommand.GET_CONF},
+            ) as response:
+                reply = await response.json(content_type=None)
+    except (ClientError, ValueError, asyncio.TimeoutError):
+        return False
+
+    return isinstance(reply, dict) and reply.get(ApiAttribute.STATUS) in {
+        ApiStatus.OK,
+        ApiStatus.FAILED,
+        ApiStatus.INVALID_TOKEN,
+        ApiStatus.TOKEN_EXPIRED,
+        ApiStatus.LOGIN_FAILED,
+    }
+
+
+async def async_discover_central_units(
+    hass: HomeAssistant, username: str, password: str
+) -> tuple[list[DiscoveredCentralUnit], bool]:
+    """Search the local subnets for Central Units.
+
+    Returns the units found, de-duplicated by unique ID, and whether a unit
+    was found that rejected the credentials.
+    """
+    hosts = await _async_local_hosts(hass)
+    open_hosts = [
+        host
+        for host, is_open in zip(
+            hosts, await _async_gather_bounded(hosts, _async_port_open)
+        )
+        if is_open
+    ]
+    _LOGGER.debug(
+        "%i of %i local hosts accept connections on port %i",
+        len(open_hosts),
+        len(hosts),
+        DISCOVERY_PORT,
+    )
+
+    websession = async_get_clientsession(hass, verify_ssl=False)
+    unit_hosts = [
+        host
+        for host, is_unit in zip(
+            open_hosts,
+            await _async_gather_bounded(
+                open_hosts, lambda host: _async_is_central_unit(websession, host)
+            ),
+        )
+        if is_unit
+    ]
+    _LOGGER.debug("%i hosts answer like a Central Unit", len(unit_hosts))
+    invalid_auth = False
+
+    async def _async_identify(host: str) -> DiscoveredCentralUnit | None:
+        nonlocal invalid_auth
+        api = CentralUnitPolling(host, username, password, websession)
+        try:
+            async with async_timeout.timeout(DISCOVERY_LOGIN_TIMEOUT_SEC):
+                # log in and read the unit details, without loading the devices
+                await api.fetch_configuration(None)
+        except SwitchBeeError as exp:
+            if "LOGIN_FAILED" in str(exp):
+                invalid_auth = True
+            return None
+        except Exception:  # pylint: disable=broad-except
+            _LOGGER.debug("Could not read the Central Unit at %s", host, exc_info=True)
+            return None
+
+        if api.unique_id:
+            unique_id = api.unique_id
+        elif api.mac:
+            unique_id = format_mac(api.mac)
+        else:
+            return None
+
+        return DiscoveredCentralUnit(host, unique_id, api.name)
+
+    units: dict[str, DiscoveredCentralUnit] = {}
+    for unit in await _async_gather_bounded(unit_hosts, _async_identify):
+        if unit is not None:
+            units.setdefault(unit.unique_id, unit)
+
+    return list(units.values()), invalid_auth
@@ -1,22 +1,17 @@
 """Support for SwitchBee entity."""
-import logging
-from typing import Generic, TypeVar, cast
+from typing import Any, Generic, TypeVar, cast
 
-from switchbee import SWITCHBEE_BRAND
-from switchbee.device import DeviceType, SwitchBeeBaseDevice
+from switchbee.device import SwitchBeeBaseDevice
 
-from homeassistant.helpers.entity import DeviceInfo
+from homeassistant.core import callback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .const import DOMAIN
+from .const import ATTR_STALE_SINCE
 from .coordinator import SwitchBeeCoordinator
 
 _DeviceTypeT = TypeVar("_DeviceTypeT", bound=SwitchBeeBaseDevice)
 
 
-_LOGGER = logging.getLogger(__name__)
-
-
 class SwitchBeeEntity(CoordinatorEntity[SwitchBeeCoordinator], Generic[_DeviceTypeT]):
     """Representation of a Switchbee entity."""
 
@@ -33,6 +28,14 @@ class SwitchBeeEntity(CoordinatorEntity[SwitchBeeCoordinator], Generic[_DeviceTy
         self._attr_name = device.name
         self._attr_unique_id = f"{coordinator.unique_id}-{device.id}"
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any] | None:
+        """Return when the state went stale, while the Central Unit is unreachable."""
+        if self.coordinator.stale_since is None:
+            return None
+
+        return {ATTR_STALE_SINCE: self.coordinator.stale_since.isoformat()}
+
 
 class SwitchBeeDeviceEntity(SwitchBeeEntity[_DeviceTypeT]):
     """Representation of a Switchbee device entity."""
@@ -44,53 +47,30 @@ class SwitchBeeDeviceEntity(SwitchBeeEntity[_DeviceTypeT]):
     ) -> None:
         """Initialize the Switchbee device."""
         super().__init__(device, coordinator)
-        self._is_online: bool = True
-        identifier = (
-            device.id if device.type == DeviceType.Thermostat else device.unit_id
-        )
-        self._attr_device_info = DeviceInfo(
-            name=device.zone,
-            identifiers={
-                (
-                    DOMAIN,
-                    f"{identifier}-{coordinator.unique_id}",
-                )
-            },
-            manufacturer=SWITCHBEE_BRAND,
-            model=coordinator.api.module_display(device.unit_id),
-            suggested_area=device.zone,
-            via_device=(
-                DOMAIN,
-                f"{coordinator.api.name} ({coordinator.api.unique_id})",
-            ),
-        )
+        self._attr_device_info = coordinator.device_info(device)
+
+    async def async_added_to_hass(self) -> None:
+        """Set the initial state, updates are only handled once the device changes."""
+        self._update_from_coordinator()
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Handle updated data from the coordinator, if the device changed."""
+        if self.coordinator.device_changed(self._device.id):
+            self._update_from_coordinator()
+            super()._handle_coordinator_update()
+
+    def _update_from_coordinator(self) -> None:
+        """Update the entity attributes from the coordinator data."""
 
     @property
     def available(self) -> bool:
         """Return True if entity is available."""
-        return self._is_online and super().available
-
-    def _check_if_became_offline(self) -> None:
-        """Check if the device was online (now offline), log message and mark it as Unavailable."""
-
-        if self._is_online:
-            _LOGGER.warning(
-                (
-                    "%s device is not responding, check the status in the SwitchBee"
-                    " mobile app"
-                ),
-                self.name,
-            )
-            self._is_online = False
-
-    def _check_if_became_online(self) -> None:
-        """Check if the device was offline (now online) and bring it back."""
-        if not self._is_online:
-            _LOGGER.info(
-                "%s device is now responding",
-                self.name,
-            )
-            self._is_online = True
+        return (
+            self.coordinator.is_module_online(self._device.unit_id)
+            and super().available
+        )
 
     def _get_coordinator_device(self) -> _DeviceTypeT:
         return cast(_DeviceTypeT, self.coordinator.data[self._device.id])
@@ -5,11 +5,12 @@ from __future__ import annotations
 from typing import Any
 
 from switchbee.api.central_unit import SwitchBeeDeviceOfflineError, SwitchBeeError
-from switchbee.device import ApiStateCommand, DeviceType, SwitchBeeDimmer
+from switchbee.device import ApiStateCommand, SwitchBeeDimmer
 
 from homeassistant.components.light import ATTR_BRIGHTNESS, ColorMode, LightEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -38,11 +39,10 @@ async def async_setup_entry(
     hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
 ) -> None:
     """Set up SwitchBee light."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
     async_add_entities(
         SwitchBeeLightEntity(switchbee_device, coordinator)
-        for switchbee_device in coordinator.data.values()
-        if switchbee_device.type == DeviceType.Dimmer
+        for switchbee_device in coordinator.platform_devices.get(Platform.LIGHT, [])
     )
 
 
@@ -62,25 +62,16 @@ class SwitchBeeLightEntity(SwitchBeeDeviceEntity[SwitchBeeDimmer], LightEntity):
         self._attr_is_on = False
         self._attr_brightness = 0
 
-        self._update_attrs_from_coordinator()
+        self._update_from_coordinator()
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_attrs_from_coordinator()
-        super()._handle_coordinator_update()
-
-    def _update_attrs_from_coordinator(self) -> None:
+    def _update_from_coordinator(self) -> None:
         coordinator_device = self._get_coordinator_device()
         brightness = coordinator_device.brightness
 
         # module is offline
         if brightness == -1:
-            self._check_if_became_offline()
             return
 
-        self._check_if_became_online()
-
         self._attr_is_on = bool(brightness != 0)
 
         # 1-99 is the only valid SwitchBee brightness range
@@ -97,7 +88,7 @@ class SwitchBeeLightEntity(SwitchBeeDeviceEntity[SwitchBeeDimmer], LightEntity):
                 state = _hass_brightness_to_switchbee(self.brightness)
 
         try:
-            await self.coordinator.api.set_state(self._device.id, state)
+            await self.coordinator.async_set_state(self._device.id, state)
         except (SwitchBeeError, SwitchBeeDeviceOfflineError) as exp:
             raise HomeAssistantError(
                 f"Failed to set {self.name} state {state}, {str(exp)}"
@@ -111,18 +102,16 @@ class SwitchBeeLightEntity(SwitchBeeDeviceEntity[SwitchBeeDimmer], LightEntity):
 
         # update the coordinator data manually we already know the Central Unit
         # brightness data for this light
-        self._get_coordinator_device().brightness = state
-        self.coordinator.async_set_updated_data(self.coordinator.data)
+        self.coordinator.async_set_device_state(self._device.id, state)
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off SwitchBee light."""
         try:
-            await self.coordinator.api.set_state(self._device.id, ApiStateCommand.OFF)
+            await self.coordinator.async_set_state(self._device.id, ApiStateCommand.OFF)
         except (SwitchBeeError, SwitchBeeDeviceOfflineError) as exp:
             raise HomeAssistantError(
                 f"Failed to turn off {self._attr_name}, {str(exp)}"
             ) from exp
 
         # update the coordinator manually
-        self._get_coordinator_device().brightness = 0
-        self.coordinator.async_set_updated_data(self.coordinator.data)
\ No newline at end of file
+        self.coordinator.async_set_device_state(self._device.id, ApiStateCommand.OFF)
\ No newline at end of file
@@ -0,0 +1,44 @@
+"""Registry migration helpers for the SwitchBee Smart Home integration."""
+
+from __future__ import annotations
+
+from collections.abc import Iterable
+import re
+
+from .const import DOMAIN
+
+
+class UniqueIdMigration:
+    """Map registry IDs built on the old Central Unit unique ID to the new one.
+
+    The patterns are compiled once and the whole registry is mapped in a
+    single pass, the updates are then applied one item at a time as the
+    registries have no batch update. See scripts/benchmark_migration.py.
+    """
+
+    def __init__(self, old_unique_id: str, new_unique_id: str) -> None:
+        """Initialize the migration."""
+        self._new_unique_id = new_unique_id
+        self._device_re = re.compile(rf"(?P<id>.+)-{re.escape(old_unique_id)}$")
+        self._entity_re = re.compile(rf"{re.escape(old_unique_id)}-(?P<id>\d+)")
+
+    def device_identifiers(
+        self, identifiers: Iterable[tuple[str, str]]
+    ) -> set[tuple[str, str]] | None:
+        """Return the new identifiers of a device, None if it needs no migration."""
+        new_identifiers = None
+        for identifier in identifiers:
+            if match := self._device_re.match(identifier[1]):
+                new_identifiers = {
+                    (DOMAIN, f"{match.group('id')}-{self._new_unique_id}")
+                }
+        return new_identifiers
+
+    def entity_unique_ids(self, unique_ids: Iterable[str]) -> dict[str, str]:
+        """Return an old -> new map of the entity unique IDs that need migration."""
+        match_entity = self._entity_re.match
+        return {
+            unique_id: f"{self._new_unique_id}-{match.group('id')}"
+            for unique_id in unique_ids
+            if (match := match_entity(unique_id))
+        }
@@ -0,0 +1,127 @@
+"""Opt-in profiling of the SwitchBee Smart Home integration."""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from contextlib import nullcontext
+from dataclasses import dataclass
+from functools import wraps
+import logging
+import time
+from types import TracebackType
+from typing import Any, ContextManager
+
+_LOGGER = logging.getLogger(__name__)
+
+_NOT_PROFILING = nullcontext()
+
+
+@dataclass
+class SectionStats:
+    """Wall time and call count of a profiled section."""
+
+    calls: int = 0
+    total: float = 0.0
+    max: float = 0.0
+    slow: int = 0
+
+
+class _Measurement:
+    """Time a single run of a section."""
+
+    __slots__ = ("_profiler", "_name", "_blocking", "_start")
+
+    def __init__(self, profiler: SwitchBeeProfiler, name: str, blocking: bool) -> None:
+        self._profiler = profiler
+        self._name = name
+        self._blocking = blocking
+        self._start = 0.0
+
+    def __enter__(self) -> None:
+        self._start = time.perf_counter()
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        self._profiler.record(
+            self._name, time.perf_counter() - self._start, self._blocking
+        )
+
+
+class SwitchBeeProfiler:
+    """Collect wall time and call counts of the integration hot paths.
+
+    Blocking sections run on the event loop without yielding, any run longer
+    than ``slow_threshold`` seconds is logged. Awaiting sections (polls and
+    API calls) are timed end to end and never flagged. Sections are measured
+    inclusively, e.g. a push update includes the entity callbacks it runs.
+    """
+
+    def __init__(self, enabled: bool, slow_threshold: float) -> None:
+        """Initialize the profiler."""
+        self.enabled = enabled
+        self.slow_threshold = slow_threshold
+        self.sections: dict[str, SectionStats] = {}
+        self.started = time.monotonic()
+
+    def measure(self, name: str, blocking: bool = True) -> ContextManager[None]:
+        """Return a context manager timing a section, a no-op when disabled."""
+        if not self.enabled:
+            return _NOT_PROFILING
+        return _Measurement(self, name, blocking)
+
+    def wrap(self, func: Callable[[], None]) -> Callable[[], None]:
+        """Return a callback timed as a blocking section named after func."""
+        if (owner := getattr(func, "__self__", None)) is not None:
+            # name entity callbacks after the entity class, not where they are defined
+            name = f"{type(owner).__name__}.{func.__name__}"
+        else:
+            name = getattr(func, "__qualname__", repr(func))
+
+        @wraps(func)
+        def _timed() -> None:
+            with _Measurement(self, name, True):
+                func()
+
+        return _timed
+
+    def record(self, name: str, elapsed: float, blocking: bool) -> None:
+        """Add a run of a section."""
+        if (stats := self.sections.get(name)) is None:
+            stats = self.sections[name] = SectionStats()
+        stats.calls += 1
+        stats.total += elapsed
+        stats.max = max(stats.max, elapsed)
+        if blocking and elapsed > self.slow_threshold:
+            stats.slow += 1
+            _LOGGER.warning(
+                "%s blocked the event loop for %.1f ms", name, elapsed * 1000
+            )
+
+    def reset(self) -> None:
+        """Forget the collected profile."""
+        self.sections.clear()
+        self.started = time.monotonic()
+
+    def summary(self) -> dict[str, Any]:
+        """Return the profile, slowest sections (by total wall time) first."""
+        return {
+            "enabled": self.enabled,
+            "duration": round(time.monotonic() - self.started, 1),
+            "slow_threshold_ms": self.slow_threshold * 1000,
+            "sections": {
+                name: {
+                    "calls": stats.calls,
+                    "total_ms": round(stats.total * 1000, 3),
+                    "avg_ms": round(stats.total * 1000 / stats.calls, 3),
+                    "max_ms": round(stats.max * 1000, 3),
+                    "slow": stats.slow,
+                }
+                for name, stats in sorted(
+                    self.sections.items(), key=lambda item: -item[1].total
+                )
+            },
+        }
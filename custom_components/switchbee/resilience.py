@@ -0,0 +1,191 @@
+"""Request timeout, retry and circuit breaker policy for the Central Unit."""
+
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Awaitable, Callable
+import logging
+import random
+import time
+from typing import Any, TypeVar
+
+from aiohttp import ClientError
+import async_timeout
+from switchbee.api import DeviceConnectionError
+from switchbee.api.central_unit import (
+    SwitchBeeDeviceOfflineError,
+    SwitchBeeError,
+    SwitchBeeTokenError,
+)
+
+from .profiler import SwitchBeeProfiler
+
+_LOGGER = logging.getLogger(__name__)
+
+_T = TypeVar("_T")
+
+# Errors meaning the Central Unit itself did not answer properly, the polling
+# API only wraps timeouts and refused connections in its own errors
+_UNIT_ERRORS = (DeviceConnectionError, ClientError, OSError)
+
+RETRY_BASE_DELAY_SEC = 0.5
+
+
+class SwitchBeeCircuitOpenError(SwitchBeeError):
+    """Error to indicate the Central Unit is not being called for a while."""
+
+
+class CircuitBreaker:
+    """Stop calling a Central Unit after repeated failures.
+
+    Once ``threshold`` consecutive operations failed the breaker opens and calls
+    are rejected right away, a read only counts once its retries ran out. After
+    ``reset_timeout`` seconds a single probe call is let through (half-open),
+    its result closes or re-opens the breaker.
+    """
+
+    def __init__(self, threshold: int, reset_timeout: float) -> None:
+        """Initialize the circuit breaker."""
+        self._threshold = threshold
+        self._reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: float | None = None
+        self._probing = False
+
+    @property
+    def is_open(self) -> bool:
+        """Return True if calls are currently rejected."""
+        return self._opened_at is not None
+
+    @property
+    def probing(self) -> bool:
+        """Return True while a probe call is let through."""
+        return self._probing
+
+    def before_call(self) -> None:
+        """Raise if the call should not reach the Central Unit."""
+        if self._opened_at is None:
+            return
+
+        if self._probing or time.monotonic() - self._opened_at < self._reset_timeout:
+            raise SwitchBeeCircuitOpenError(
+                "Central Unit is not responding, waiting before trying again"
+            )
+
+        _LOGGER.debug("Probing the Central Unit")
+        self._probing = True
+
+    def record_success(self) -> None:
+        """Close the breaker."""
+        if self._opened_at is not None:
+            _LOGGER.info("Central Unit is responding again")
+
+        self._failures = 0
+        self._opened_at = None
+        self._probing = False
+
+    def abort_probe(self) -> None:
+        """Let the next call probe again, the current probe was cancelled."""
+        self._probing = False
+
+    def record_failure(self) -> None:
+        """Count a failure, opening the breaker when the threshold is reached."""
+        self._failures += 1
+        if self._probing or (
+            self._opened_at is None and self._failures >= self._threshold
+        ):
+            if self._opened_at is None:
+                _LOGGER.warning(
+                    "Central Unit failed %i requests in a row, pausing requests for %s"
+                    " seconds",
+                    self._failures,
+                    self._reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+            self._probing = False
+
+
+class RequestPolicy:
+    """Apply deadlines, retries and the circuit breaker to Central Unit calls."""
+
+    def __init__(
+        self,
+        timeout: float,
+        read_retries: int,
+        breaker: CircuitBreaker,
+        profiler: SwitchBeeProfiler,
+    ) -> None:
+        """Initialize the request policy."""
+        self.timeout = timeout
+        self.read_retries = read_retries
+        self.breaker = breaker
+        self.profiler = profiler
+
+    async def _async_call(self, func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Call the Central Unit once, within the deadline.
+
+        Unit errors are raised as SwitchBeeError, the caller records the failure
+        once the operation gives up.
+        """
+        self.breaker.before_call()
+        try:
+            with self.profiler.measure(f"api.{func.__name__}", blocking=False):
+                async with async_timeout.timeout(self.timeout):
+                    result = await func(*args)
+        except asyncio.TimeoutError as exp:
+            raise SwitchBeeError(
+                f"Central Unit did not reply within {self.timeout} seconds"
+            ) from exp
+        except SwitchBeeError:
+            raise
+        except SwitchBeeDeviceOfflineError:
+            # device level errors still prove the unit is up
+            self.breaker.record_success()
+            raise
+        except _UNIT_ERRORS as exp:
+            raise SwitchBeeError(f"Failed to reach the Central Unit: {exp}") from exp
+        except (SwitchBeeTokenError, asyncio.CancelledError):
+            # the library logs in again on the next call, the unit is alive
+            self.breaker.abort_probe()
+            raise
+        except Exception:
+            # unexpected errors say nothing about the unit
+            self.breaker.abort_probe()
+            raise
+
+        self.breaker.record_success()
+        return result
+
+    async def async_read(self, func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Call an idempotent read, retrying with a jittered exponential backoff."""
+        attempt = 0
+        while True:
+            try:
+                return await self._async_call(func, *args)
+            except SwitchBeeCircuitOpenError:
+                raise
+            except (SwitchBeeError, SwitchBeeTokenError) as exp:
+                # a failed probe re-opens the breaker right away
+                if attempt >= self.read_retries or self.breaker.probing:
+                    if isinstance(exp, SwitchBeeError):
+                        self.breaker.record_failure()
+                    raise
+                delay = RETRY_BASE_DELAY_SEC * 2**attempt * random.uniform(0.5, 1.5)
+                attempt += 1
+                _LOGGER.debug(
+                    "Central Unit read failed (%s), retry %i in %.1f seconds",
+                    exp,
+                    attempt,
+                    delay,
+                )
+                await asyncio.sleep(delay)
+
+    async def async_command(self, func: Callable[..., Awaitable[_T]], *args: Any) -> _T:
+        """Send a command once, commands are not retried as they may not be idempotent."""
+        try:
+            return await self._async_call(func, *args)
+        except SwitchBeeCircuitOpenError:
+            raise
+        except SwitchBeeError:
+            self.breaker.record_failure()
+            raise
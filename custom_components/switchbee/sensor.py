@@ -0,0 +1,73 @@
+"""Support for SwitchBee timed power switch countdown sensor."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+
+from switchbee.device import ApiStateCommand, SwitchBeeTimerSwitch
+
+from homeassistant.components.sensor import SensorDeviceClass, SensorEntity
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity_platform import AddEntitiesCallback
+from homeassistant.util import dt as dt_util
+
+from .const import DOMAIN, TIMER_DRIFT_SEC
+from .coordinator import SwitchBeeCoordinator
+from .entity import SwitchBeeDeviceEntity
+
+
+async def async_setup_entry(
+    hass: HomeAssistant, entry: ConfigEntry, async_add_entities: AddEntitiesCallback
+) -> None:
+    """Set up SwitchBee sensor."""
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    async_add_entities(
+        SwitchBeeTimerEndSensor(switchbee_device, coordinator)
+        for switchbee_device in coordinator.platform_devices.get(Platform.SENSOR, [])
+    )
+
+
+class SwitchBeeTimerEndSensor(
+    SwitchBeeDeviceEntity[SwitchBeeTimerSwitch], SensorEntity
+):
+    """When a timed power switch turns off.
+
+    The end time is stored once and the frontend counts down to it, reported
+    minutes left only move it when they drift more than TIMER_DRIFT_SEC away.
+    """
+
+    _attr_device_class = SensorDeviceClass.TIMESTAMP
+
+    def __init__(
+        self,
+        device: SwitchBeeTimerSwitch,
+        coordinator: SwitchBeeCoordinator,
+    ) -> None:
+        """Initialize the SwitchBee timer sensor."""
+        super().__init__(device, coordinator)
+        self._attr_name = f"{device.name} timer end"
+        self._attr_unique_id = f"{coordinator.unique_id}-{device.id}-timer_end"
+        self._attr_native_value: datetime | None = None
+
+        self._update_from_coordinator()
+
+    def _update_from_coordinator(self) -> None:
+        coordinator_device = self._get_coordinator_device()
+
+        # module is offline
+        if coordinator_device.state == ApiStateCommand.OFFLINE:
+            return
+
+        minutes_left = coordinator_device.minutes_left
+        if coordinator_device.state == ApiStateCommand.OFF or minutes_left <= 0:
+            self._attr_native_value = None
+            return
+
+        end = dt_util.utcnow().replace(microsecond=0) + timedelta(minutes=minutes_left)
+        if (
+            self._attr_native_value is None
+            or abs((end - self._attr_native_value).total_seconds()) > TIMER_DRIFT_SEC
+        ):
+            self._attr_native_value = end
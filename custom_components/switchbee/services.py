@@ -0,0 +1,128 @@
+"""Services for the SwitchBee Smart Home integration."""
+
+from __future__ import annotations
+
+import logging
+
+from switchbee.device import DeviceType
+import voluptuous as vol
+
+from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+
+from .const import ATTR_DEVICE_TYPE, ATTR_RESET, ATTR_STATE, ATTR_ZONE, DOMAIN
+from .coordinator import SwitchBeeCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+SERVICE_REFRESH_ZONE = "refresh_zone"
+SERVICE_SET_ZONE_STATE = "set_zone_state"
+SERVICE_DUMP_PROFILE = "dump_profile"
+SERVICE_START_CAPTURE = "start_capture"
+SERVICE_STOP_CAPTURE = "stop_capture"
+
+REFRESH_ZONE_SCHEMA = vol.Schema({vol.Required(ATTR_ZONE): cv.string})
+
+SET_ZONE_STATE_SCHEMA = vol.Schema(
+    {
+        vol.Required(ATTR_ZONE): cv.string,
+        vol.Required(ATTR_STATE): vol.Any(vol.Coerce(int), cv.string),
+        vol.Optional(ATTR_DEVICE_TYPE): vol.All(
+            cv.ensure_list, [vol.In([device_type.name for device_type in DeviceType])]
+        ),
+    }
+)
+
+DUMP_PROFILE_SCHEMA = vol.Schema({vol.Optional(ATTR_RESET, default=False): cv.boolean})
+
+
+def _zone_coordinators(hass: HomeAssistant, zone: str) -> list[SwitchBeeCoordinator]:
+    """Return the coordinators of all Central Units that have the given zone."""
+    return [
+        coordinator
+        for coordinator in hass.data[DOMAIN].values()
+        if zone in coordinator.zones
+    ]
+
+
+def async_setup_services(hass: HomeAssistant) -> None:
+    """Register the SwitchBee services."""
+
+    if hass.services.has_service(DOMAIN, SERVICE_REFRESH_ZONE):
+        return
+
+    async def async_refresh_zone(call: ServiceCall) -> None:
+        """Fetch the state of all devices in a zone."""
+        for coordinator in _zone_coordinators(hass, call.data[ATTR_ZONE]):
+            await coordinator.async_refresh_zone(call.data[ATTR_ZONE])
+
+    async def async_set_zone_state(call: ServiceCall) -> None:
+        """Set the state of all (matching) devices in a zone."""
+        device_types = (
+            [DeviceType[name] for name in call.data[ATTR_DEVICE_TYPE]]
+            if ATTR_DEVICE_TYPE in call.data
+            else None
+        )
+        for coordinator in _zone_coordinators(hass, call.data[ATTR_ZONE]):
+            await coordinator.async_set_zone_state(
+                call.data[ATTR_ZONE], call.data[ATTR_STATE], device_types
+            )
+
+    async def async_dump_profile(call: ServiceCall) -> None:
+        """Log the profile of all Central Units that are being profiled."""
+        coordinators = [
+            coordinator
+            for coordinator in hass.data[DOMAIN].values()
+            if coordinator.profiler.enabled
+        ]
+        if not coordinators:
+            raise HomeAssistantError(
+                "Profiling is not enabled, turn it on in the integration options"
+            )
+
+        for coordinator in coordinators:
+            _LOGGER.warning(
+                "Profile of Central Unit %s: %s",
+                coordinator.unique_id,
+                coordinator.profiler.summary(),
+            )
+            if call.data[ATTR_RESET]:
+                coordinator.profiler.reset()
+
+    async def async_start_capture(call: ServiceCall) -> None:
+        """Start recording the traffic of all Central Units."""
+        for coordinator in hass.data[DOMAIN].values():
+            await coordinator.async_start_capture()
+
+    async def async_stop_capture(call: ServiceCall) -> None:
+        """Stop recording and write the captures."""
+        for coordinator in hass.data[DOMAIN].values():
+            await coordinator.async_stop_capture()
+
+    hass.services.async_register(
+        DOMAIN, SERVICE_REFRESH_ZONE, async_refresh_zone, schema=REFRESH_ZONE_SCHEMA
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_ZONE_STATE,
+        async_set_zone_state,
+        schema=SET_ZONE_STATE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN, SERVICE_DUMP_PROFILE, async_dump_profile, schema=DUMP_PROFILE_SCHEMA
+    )
+    hass.services.async_register(DOMAIN, SERVICE_START_CAPTURE, async_start_capture)
+    hass.services.async_register(DOMAIN, SERVICE_STOP_CAPTURE, async_stop_capture)
+
+
+def async_unload_services(hass: HomeAssistant) -> None:
+    """Remove the SwitchBee services once the last Central Unit is unloaded."""
+    if hass.data[DOMAIN]:
+        return
+
+    hass.services.async_remove(DOMAIN, SERVICE_REFRESH_ZONE)
+    hass.services.async_remove(DOMAIN, SERVICE_SET_ZONE_STATE)
+    hass.services.async_remove(DOMAIN, SERVICE_DUMP_PROFILE)
+    hass.services.async_remove(DOMAIN, SERVICE_START_CAPTURE)
+    hass.services.async_remove(DOMAIN, SERVICE_STOP_CAPTURE)
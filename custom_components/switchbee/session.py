@@ -0,0 +1,200 @@
+"""Central Unit session management for the SwitchBee Smart Home integration."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass, field
+import logging
+import time
+
+from aiohttp import ClientSession
+from switchbee.api import CentralUnitPolling, CentralUnitWsRPC, is_wsrpc_api
+from switchbee.api.central_unit import SwitchBeeError
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryNotReady
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.singleton import singleton
+
+from .const import (
+    DATA_SESSION_MANAGER,
+    SESSION_IDLE_RELEASE_SEC,
+    TOKEN_REFRESH_MARGIN_SEC,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def get_api_object(
+    central_unit: str, user: str, password: str, websession: ClientSession
+) -> CentralUnitPolling | CentralUnitWsRPC:
+    """Return SwitchBee API object."""
+
+    api: CentralUnitPolling | CentralUnitWsRPC = CentralUnitPolling(
+        central_unit, user, password, websession
+    )
+    # First try to connect and fetch the version
+    try:
+        await api.connect()
+    except SwitchBeeError as exp:
+        raise ConfigEntryNotReady("Failed to connect to the Central Unit") from exp
+
+    # Check if websocket version
+    if is_wsrpc_api(api):
+        api = CentralUnitWsRPC(central_unit, user, password, websession)
+        await api.connect()
+
+    return api
+
+
+@dataclass
+class _Session:
+    """Authenticated API object of a config entry."""
+
+    credentials: tuple[str, str, str]
+    task: asyncio.Task[CentralUnitPolling | CentralUnitWsRPC]
+    cancel_refresh: CALLBACK_TYPE | None = field(default=None)
+    cancel_release: CALLBACK_TYPE | None = field(default=None)
+
+
+@singleton(DATA_SESSION_MANAGER)
+@callback
+def async_get_session_manager(hass: HomeAssistant) -> SwitchBeeSessionManager:
+    """Return the SwitchBee session manager."""
+    return SwitchBeeSessionManager(hass)
+
+
+class SwitchBeeSessionManager:
+    """Keep the Central Unit API objects logged in across config entry reloads."""
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the session manager."""
+        self._hass = hass
+        self._sessions: dict[str, _Session] = {}
+
+    @callback
+    def async_prewarm(self, entry: ConfigEntry) -> None:
+        """Start connecting to the Central Unit without waiting for the result."""
+        self._async_get_session(entry)
+
+    async def async_get_api(
+        self, entry: ConfigEntry
+    ) -> CentralUnitPolling | CentralUnitWsRPC:
+        """Return a connected API object, reusing the existing session if possible."""
+        session = self._async_get_session(entry)
+        if session.cancel_release is not None:
+            # set up again (reloaded) before the idle session was released
+            session.cancel_release()
+            session.cancel_release = None
+        try:
+            api = await asyncio.shield(session.task)
+        except Exception:
+            # don't keep a failed connection attempt around
+            self.async_release(entry.entry_id)
+            raise
+
+        if session.cancel_refresh is None:
+            self._async_schedule_token_refresh(entry.entry_id, api)
+
+        return api
+
+    @callback
+    def async_release_when_idle(self, entry_id: str) -> None:
+        """Release the session of an unloaded entry unless it is set up again soon."""
+        if (session := self._sessions.get(entry_id)) is None:
+            return
+
+        @callback
+        def _async_release_idle(_now: object) -> None:
+            session.cancel_release = None
+            _LOGGER.debug("Closing the unused Central Unit session of %s", entry_id)
+            self.async_release(entry_id)
+
+        if session.cancel_release is None:
+            session.cancel_release = async_call_later(
+                self._hass, SESSION_IDLE_RELEASE_SEC, _async_release_idle
+            )
+
+    @callback
+    def async_release(self, entry_id: str) -> None:
+        """Forget the session of an entry, closing its websocket."""
+        if (session := self._sessions.pop(entry_id, None)) is None:
+            return
+
+        if session.cancel_refresh is not None:
+            session.cancel_refresh()
+        if session.cancel_release is not None:
+            session.cancel_release()
+        if not session.task.done():
+            session.task.cancel()
+        elif (
+            not session.task.cancelled()
+            and session.task.exception() is None
+            and isinstance(api := session.task.result(), CentralUnitWsRPC)
+            # pylint: disable-next=protected-access
+            and (client := api._client) is not None
+        ):
+            # the receive loop of the library ends once the websocket is closed
+            self._hass.async_create_task(client.close())
+
+    @staticmethod
+    def _credentials(entry: ConfigEntry) -> tuple[str, str, str]:
+        return (
+            entry.data[CONF_HOST],
+            entry.data[CONF_USERNAME],
+            entry.data[CONF_PASSWORD],
+        )
+
+    @callback
+    def _async_get_session(self, entry: ConfigEntry) -> _Session:
+        """Return the session of an entry, connecting if needed."""
+        credentials = self._credentials(entry)
+        if (session := self._sessions.get(entry.entry_id)) is not None:
+            if session.credentials == credentials:
+                return session
+            # the host or credentials changed, start over
+            self.async_release(entry.entry_id)
+
+        websession = async_get_clientsession(self._hass, verify_ssl=False)
+        session = self._sessions[entry.entry_id] = _Session(
+            credentials,
+            self._hass.async_create_task(get_api_object(*credentials, websession)),
+        )
+        # retrieve a failed pre-warm result so it is not logged as never retrieved
+        session.task.add_done_callback(
+            lambda task: task.cancelled() or task.exception()
+        )
+        return session
+
+    @callback
+    def _async_schedule_token_refresh(
+        self, entry_id: str, api: CentralUnitPolling | CentralUnitWsRPC
+    ) -> None:
+        """Log in again shortly before the token expires, not on a failed request."""
+        # pylint: disable-next=protected-access
+        expires_in = api._token_expiration / 1000 - time.time()
+        delay = max(expires_in - TOKEN_REFRESH_MARGIN_SEC, TOKEN_REFRESH_MARGIN_SEC)
+
+        async def _async_refresh_token(_now: object) -> None:
+            if (session := self._sessions.get(entry_id)) is None:
+                return
+
+            session.cancel_refresh = None
+            if isinstance(api, CentralUnitWsRPC) and not api.connected:
+                # the websocket is re-established (and logged in) on the next request
+                _LOGGER.debug("Central Unit websocket is down, skipping token refresh")
+            else:
+                try:
+                    await api._login()  # pylint: disable=protected-access
+                except Exception as exp:  # pylint: disable=broad-except
+                    _LOGGER.debug("Failed to refresh the Central Unit token: %s", exp)
+
+            self._async_schedule_token_refresh(entry_id, api)
+
+        if (session := self._sessions.get(entry_id)) is not None:
+            session.cancel_refresh = async_call_later(
+                self._hass, delay, _async_refresh_token
+            )
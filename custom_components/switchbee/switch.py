@@ -15,7 +15,8 @@ from switchbee.device import (
 
 from homeassistant.components.switch import SwitchEntity
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant, callback
+from homeassistant.const import Platform
+from homeassistant.core import HomeAssistant
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
 
@@ -42,16 +43,7 @@ async def async_setup_entry(
 
     async_add_entities(
         SwitchBeeSwitchEntity(device, coordinator)
-        for device in coordinator.data.values()
-        if isinstance(
-            device,
-            (
-                SwitchBeeTimedSwitch,
-                SwitchBeeGroupSwitch,
-                SwitchBeeSwitch,
-                SwitchBeeTimerSwitch,
-            ),
-        )
+        for device in coordinator.platform_devices.get(Platform.SWITCH, [])
     )
 
 
@@ -67,23 +59,15 @@ class SwitchBeeSwitchEntity(SwitchBeeDeviceEntity[_DeviceTypeT], SwitchEntity):
         super().__init__(device, coordinator)
         self._attr_is_on = False
 
-    @callback
-    def _handle_coordinator_update(self) -> None:
-        """Handle updated data from the coordinator."""
-        self._update_from_coordinator()
-        super()._handle_coordinator_update()
-
     def _update_from_coordinator(self) -> None:
         """Update the entity attributes from the coordinator data."""
 
         coordinator_device = self._get_coordinator_device()
 
-        if coordinator_device.state == -1:
-            self._check_if_became_offline()
+        # the module is offline, availability is tracked by the coordinator
+        if coordinator_device.state in (-1, ApiStateCommand.OFFLINE):
             return
 
-        self._check_if_became_online()
-
         # timed power switch state is an integer representing the number of minutes left until it goes off
         # regulare switches state is ON/OFF (1/0 respectively)
         self._attr_is_on = coordinator_device.state != ApiStateCommand.OFF
@@ -98,7 +82,7 @@ class SwitchBeeSwitchEntity(SwitchBeeDeviceEntity[_DeviceTypeT], SwitchEntity):
 
     async def _async_set_state(self, state: str) -> None:
         try:
-            await self.coordinator.api.set_state(self._device.id, state)
+            await self.coordinator.async_set_state(self._device.id, state)
         except (SwitchBeeError, SwitchBeeDeviceOfflineError) as exp:
             await self.coordinator.async_refresh()
             raise HomeAssistantError(
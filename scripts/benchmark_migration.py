@@ -0,0 +1,117 @@
+"""Benchmark the version 1 to 2 registry migration on a synthetic registry.
+
+Builds device and entity registries with IDs based on a Central Unit MAC
+address and times async_migrate_entry rewriting them to the unique ID. The
+Central Unit is not contacted, its unique ID is returned by a stand-in
+session.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_migration.py [--entities 10000] [--devices 1000]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import statistics
+import sys
+import tempfile
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import device_registry as dr, entity_registry as er
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee import async_migrate_entry  # noqa: E402
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.const import DOMAIN  # noqa: E402
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.session import (  # noqa: E402
+    SwitchBeeSessionManager,
+)
+
+OLD_UNIQUE_ID = "a8:21:08:e7:67:b6"
+NEW_UNIQUE_ID = "0123456789ab"
+
+
+async def _async_run(config_dir: str, entities: int, devices: int) -> float:
+    """Build a version 1 registry and return the migration time in seconds."""
+    hass = HomeAssistant()
+    hass.config.config_dir = config_dir
+    hass.config_entries = ConfigEntries(hass, {})
+    await asyncio.gather(dr.async_load(hass), er.async_load(hass))
+
+    entry = ConfigEntry(1, DOMAIN, "benchmark", {}, "user", unique_id=OLD_UNIQUE_ID)
+    dev_reg = dr.async_get(hass)
+    ent_reg = er.async_get(hass)
+    device_ids = [
+        dev_reg.async_get_or_create(
+            config_entry_id=entry.entry_id,
+            identifiers={(DOMAIN, f"{device}-{OLD_UNIQUE_ID}")},
+        ).id
+        for device in range(devices)
+    ]
+    for entity in range(entities):
+        ent_reg.async_get_or_create(
+            "switch",
+            DOMAIN,
+            f"{OLD_UNIQUE_ID}-{entity}",
+            config_entry=entry,
+            device_id=device_ids[entity % devices],
+        )
+
+    async def _async_get_api(self, entry):
+        return SimpleNamespace(unique_id=NEW_UNIQUE_ID)
+
+    with patch.object(SwitchBeeSessionManager, "async_get_api", _async_get_api):
+        start = time.perf_counter()
+        await async_migrate_entry(hass, entry)
+        elapsed = time.perf_counter() - start
+
+    assert entry.version == 2
+    assert ent_reg.async_get_entity_id(
+        "switch", DOMAIN, f"{NEW_UNIQUE_ID}-{entities - 1}"
+    )
+    await hass.async_stop(force=True)
+    return elapsed
+
+
+async def _async_main(entities: int, devices: int, runs: int) -> None:
+    times = []
+    for _ in range(runs):
+        with tempfile.TemporaryDirectory() as config_dir:
+            times.append(await _async_run(config_dir, entities, devices))
+
+    print(
+        f"{entities} entities on {devices} devices, {runs} runs: "
+        f"min {min(times) * 1000:.0f} ms, "
+        f"median {statistics.median(times) * 1000:.0f} ms, "
+        f"max {max(times) * 1000:.0f} ms"
+    )
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--entities", type=int, default=10000)
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--runs", type=int, default=5)
+    args = parser.parse_args()
+
+    # the migration logs a summary line, keep the output to the timings
+    logging.basicConfig(level=logging.WARNING)
+    asyncio.run(_async_main(args.entities, args.devices, args.runs))
+
+
+if __name__ == "__main__":
+    main()
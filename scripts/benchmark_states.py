@@ -0,0 +1,218 @@
+"""Benchmark the state updates of the coordinator on a synthetic Central Unit.
+
+Sets up a config entry, with its platforms and entities, on a stand-in
+Central Unit answering from memory, and times the polls applying the state
+reply (_apply_states) and updating the entities, with an unchanged reply and
+with a share of the devices changed.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/benchmark_states.py [--devices 1000] [--changed 0.05]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import logging
+from pathlib import Path
+import random
+import statistics
+import sys
+import tempfile
+import time
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from switchbee.api import CentralUnitPolling
+from switchbee.const import ApiAttribute, ApiStatus
+
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import CONF_HOST, CONF_PASSWORD, CONF_USERNAME
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import DATA_ENTITY_SOURCE
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.const import DOMAIN  # noqa: E402
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.coordinator import SwitchBeeCoordinator  # noqa: E402
+
+DEVICES_PER_ZONE = 50
+
+# (type, hardware, initial state) of the synthetic devices, in turn
+DEVICE_KINDS = (
+    ("SWITCH", "REGULAR_SWITCH", "OFF"),
+    ("DIMMER", "DIMMABLE_SWITCH", 50),
+    ("SHUTTER", "SHUTTER", 30),
+)
+
+
+class SyntheticCentralUnit(CentralUnitPolling):
+    """A Central Unit answering with synthetic devices, from memory."""
+
+    def __init__(self, devices: int, websession: ClientSession) -> None:
+        """Initialize the synthetic Central Unit."""
+        super().__init__("benchmark", "", "", websession)
+        self.states: dict[int, Any] = {}
+        zones: list[dict[str, Any]] = []
+        for device_id in range(1, devices + 1):
+            if device_id % DEVICES_PER_ZONE == 1:
+                zones.append({"name": f"Zone {len(zones) + 1}", "items": []})
+            device_type, hardware, state = DEVICE_KINDS[device_id % len(DEVICE_KINDS)]
+            zones[-1]["items"].append(
+                {
+                    "id": device_id,
+                    "name": f"{device_type.title()} {device_id}",
+                    "type": device_type,
+                    "hw": hardware,
+                }
+            )
+            self.states[device_id] = state
+        self._configuration = {
+            ApiAttribute.STATUS: ApiStatus.OK,
+            ApiAttribute.DATA: {
+                "name": "Benchmark",
+                "version": "1.4.5(1)",
+                "mac": "00:00:00:00:00:00",
+                "cuCode": "benchmark",
+                "zones": zones,
+            },
+        }
+
+    async def _login(self) -> None:
+        self._update_login({ApiAttribute.DATA: {ApiAttribute.TOKEN: "benchmark"}})
+
+    async def get_configuration(self) -> dict:
+        return self._configuration
+
+    async def get_multiple_states(self, ids: list) -> dict:
+        if not ids:
+            return {}
+
+        return {
+            ApiAttribute.STATUS: ApiStatus.OK,
+            ApiAttribute.DATA: [
+                {ApiAttribute.ID: device_id, ApiAttribute.STATE: self.states[device_id]}
+                for device_id in ids
+            ],
+        }
+
+    def change_states(self, count: int) -> None:
+        """Change the state of count random devices."""
+        for device_id in random.sample(list(self.states), count):
+            state = self.states[device_id]
+            if isinstance(state, int):
+                self.states[device_id] = (state + 1) % 100
+            else:
+                self.states[device_id] = "ON" if state == "OFF" else "OFF"
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant, api: SyntheticCentralUnit
+) -> SwitchBeeCoordinator:
+    """Set up a config entry, and all its platforms, on the synthetic unit."""
+    hass.config.components.add("network")
+    hass.config.skip_pip = True
+    # normally set up while Home Assistant starts
+    hass.data[DATA_ENTITY_SOURCE] = {}
+    # the integration is loaded from this checkout
+    hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+    hass.config_entries = ConfigEntries(hass, {})
+    await asyncio.gather(ar.async_load(hass), dr.async_load(hass), er.async_load(hass))
+    await hass.config_entries.async_initialize()
+
+    entry = ConfigEntry(
+        2,
+        DOMAIN,
+        "benchmark",
+        {CONF_HOST: "benchmark", CONF_USERNAME: "", CONF_PASSWORD: ""},
+        "user",
+        unique_id=api.unique_id,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # the polls are timed one by one
+    coordinator.update_interval = None
+    return coordinator
+
+
+async def _async_time_polls(
+    hass: HomeAssistant,
+    coordinator: SwitchBeeCoordinator,
+    api: SyntheticCentralUnit,
+    changed: int,
+    runs: int,
+) -> list[float]:
+    """Return the time in seconds of runs polls, changed devices each."""
+    times = []
+    for _ in range(runs):
+        api.change_states(changed)
+        start = time.perf_counter()
+        await coordinator.async_refresh()
+        await hass.async_block_till_done()
+        times.append(time.perf_counter() - start)
+    return times
+
+
+async def _async_main(devices: int, changed: float, runs: int) -> None:
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+        async with ClientSession() as websession:
+            api = SyntheticCentralUnit(devices, websession)
+            await api.connect()
+
+            async def _async_get_api_object(*args: Any) -> SyntheticCentralUnit:
+                return api
+
+            with patch(
+                "custom_components.switchbee.session.get_api_object",
+                _async_get_api_object,
+            ):
+                coordinator = await _async_setup_entry(hass, api)
+                print(
+                    f"{len(api.devices)} devices, "
+                    f"{len(hass.states.async_all())} entities, {runs} runs"
+                )
+                for label, count in (
+                    ("unchanged", 0),
+                    (f"{changed:.0%} changed", round(devices * changed)),
+                ):
+                    times = await _async_time_polls(hass, coordinator, api, count, runs)
+                    print(
+                        f"{label}: "
+                        f"min {min(times) * 1000:.2f} ms, "
+                        f"median {statistics.median(times) * 1000:.2f} ms, "
+                        f"max {max(times) * 1000:.2f} ms"
+                    )
+
+        await hass.async_stop(force=True)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--devices", type=int, default=1000)
+    parser.add_argument("--changed", type=float, default=0.05)
+    parser.add_argument("--runs", type=int, default=50)
+    args = parser.parse_args()
+
+    # the integration logs its setup, keep the output to the timings
+    logging.basicConfig(level=logging.ERROR)
+    asyncio.run(_async_main(args.devices, args.changed, args.runs))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,287 @@
+"""Replay a Central Unit traffic capture through the SwitchBee coordinator.
+
+Captures are recorded with the switchbee.start_capture and
+switchbee.stop_capture services. The replay sets up a config entry with all
+its platforms on a Central Unit answering from the capture, and feeds the
+captured polls and pushes through the coordinator and the entities. The
+replayed unit has its own unique ID, it never shares registry entries with
+the real one. The throughput (and with --profile the profile of the
+integration) is printed when done.
+
+Run from the repository root with Home Assistant installed:
+
+    python scripts/replay_capture.py <capture.jsonl.gz> [--speed 10 | max] [--profile]
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import logging
+from pathlib import Path
+import sys
+import tempfile
+from typing import Any
+from unittest.mock import patch
+
+from aiohttp import ClientSession
+from switchbee.api import CentralUnitWsRPC
+from switchbee.const import ApiAttribute, ApiStatus
+from switchbee.device import DeviceType
+
+from homeassistant import loader
+from homeassistant.config_entries import ConfigEntries, ConfigEntry
+from homeassistant.const import (
+    CONF_HOST,
+    CONF_PASSWORD,
+    CONF_USERNAME,
+    EVENT_STATE_CHANGED,
+)
+from homeassistant.core import Event, HomeAssistant, callback
+from homeassistant.helpers import (
+    area_registry as ar,
+    device_registry as dr,
+    entity_registry as er,
+)
+from homeassistant.helpers.entity import DATA_ENTITY_SOURCE
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[1]))
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.capture import (  # noqa: E402
+    CAPTURE_CONFIGURATION,
+    CAPTURE_PUSH,
+    CAPTURE_STATES,
+    CaptureRecord,
+    load_capture,
+)
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.const import CONF_PROFILING, DOMAIN  # noqa: E402
+
+# pylint: disable-next=wrong-import-position
+from custom_components.switchbee.coordinator import SwitchBeeCoordinator  # noqa: E402
+
+# replayed units never share the unique ID (and registry entries) of the real one
+REPLAY_UNIQUE_ID_PREFIX = "replay-"
+
+
+class ReplayCentralUnit(CentralUnitWsRPC):
+    """A Central Unit answering from a capture instead of the network.
+
+    Reads return the last replayed states and commands are accepted without
+    effect, pushes are fed through the regular notification handling.
+    """
+
+    def __init__(
+        self,
+        path: str,
+        records: list[CaptureRecord],
+        websession: ClientSession,
+    ) -> None:
+        """Initialize the replayed Central Unit."""
+        super().__init__(path, "", "", websession)
+        self.path = path
+        self.records = records
+        self._configuration = next(
+            record.data for record in records if record.kind == CAPTURE_CONFIGURATION
+        )
+        self._states: dict[int, Any] = {}
+        self._pending: dict[str, Any] | None = None
+        if first_states := next(
+            (record.data for record in records if record.kind == CAPTURE_STATES), None
+        ):
+            self.queue_states(first_states)
+
+    @property
+    def connected(self) -> bool:
+        """Return True, there is no connection to lose."""
+        return True
+
+    async def connect(self) -> None:
+        """Load the captured configuration."""
+        await self._login()
+        await self.fetch_configuration()
+
+    async def fetch_configuration(
+        self, include: list[DeviceType] | None = []  # noqa: B006
+    ) -> None:
+        """Load the captured configuration, under the replay unique ID."""
+        await super().fetch_configuration(include)
+        self._unique_id = f"{REPLAY_UNIQUE_ID_PREFIX}{self._unique_id or self.mac}"
+
+    async def _login(self) -> None:
+        self._update_login({ApiAttribute.DATA: {ApiAttribute.TOKEN: "replay"}})
+
+    async def get_configuration(self) -> dict:
+        return self._configuration
+
+    async def get_multiple_states(self, ids: list) -> dict:
+        if not ids:
+            return {}
+        if (pending := self._pending) is not None:
+            # hand out the captured reply as is, once
+            self._pending = None
+            return pending
+
+        wanted = set(ids)
+        return {
+            ApiAttribute.STATUS: ApiStatus.OK,
+            ApiAttribute.DATA: [
+                {ApiAttribute.ID: device_id, ApiAttribute.STATE: state}
+                for device_id, state in self._states.items()
+                if device_id in wanted
+            ],
+        }
+
+    async def set_state(self, id: int, state: str | int | dict[str, int | str]) -> dict:
+        return {ApiAttribute.STATUS: ApiStatus.OK, ApiAttribute.DATA: state}
+
+    def queue_states(self, states: dict[str, Any]) -> None:
+        """Answer the next state read with a captured reply."""
+        self._pending = states
+        for device_state in states.get(ApiAttribute.DATA, []):
+            self._states[device_state[ApiAttribute.ID]] = device_state[
+                ApiAttribute.STATE
+            ]
+
+
+async def async_replay(
+    coordinator: SwitchBeeCoordinator, api: ReplayCentralUnit, speed: float | None
+) -> dict[str, Any]:
+    """Feed the capture through the coordinator, at the capture speed.
+
+    Captured polls refresh the coordinator and pushes go through the
+    notification handler. The coordinator does not poll on its own.
+    """
+    coordinator.update_interval = None
+    loop = asyncio.get_running_loop()
+    polls = pushes = 0
+    start = loop.time()
+    for record in api.records:
+        if speed is not None:
+            if (delay := record.time / speed - (loop.time() - start)) > 0:
+                await asyncio.sleep(delay)
+        else:
+            await asyncio.sleep(0)
+
+        if record.kind == CAPTURE_STATES:
+            api.queue_states(record.data)
+            await coordinator.async_refresh()
+            polls += 1
+        elif record.kind == CAPTURE_PUSH:
+            api.handle_frame(record.data)
+            pushes += 1
+
+    elapsed = loop.time() - start
+    return {
+        "speed": speed or "max",
+        "devices": len(api.devices),
+        "polls": polls,
+        "pushes": pushes,
+        "seconds": round(elapsed, 3),
+        "records_per_second": round((polls + pushes) / elapsed, 1) if elapsed else 0,
+    }
+
+
+async def _async_setup_entry(
+    hass: HomeAssistant, api: ReplayCentralUnit, profile: bool
+) -> SwitchBeeCoordinator:
+    """Set up a config entry, and all its platforms, on the replayed unit."""
+    hass.config.components.add("network")
+    hass.config.skip_pip = True
+    # normally set up while Home Assistant starts
+    hass.data[DATA_ENTITY_SOURCE] = {}
+    hass.config_entries = ConfigEntries(hass, {})
+    await asyncio.gather(ar.async_load(hass), dr.async_load(hass), er.async_load(hass))
+    await hass.config_entries.async_initialize()
+
+    entry = ConfigEntry(
+        2,
+        DOMAIN,
+        f"Replay of {api.name}",
+        {CONF_HOST: api.path, CONF_USERNAME: "", CONF_PASSWORD: ""},
+        "user",
+        options={CONF_PROFILING: profile},
+        unique_id=api.unique_id,
+    )
+    await hass.config_entries.async_add(entry)
+    await hass.async_block_till_done()
+
+    coordinator: SwitchBeeCoordinator = hass.data[DOMAIN][entry.entry_id]
+    # the deferred platforms are set up in the background
+    while coordinator.deferred_platforms_pending or not (
+        coordinator.deferred_setup is None or coordinator.deferred_setup.done()
+    ):
+        await asyncio.sleep(0.01)
+    await hass.async_block_till_done()
+    return coordinator
+
+
+async def _async_main(path: str, speed: float | None, profile: bool) -> None:
+    records = await asyncio.get_running_loop().run_in_executor(None, load_capture, path)
+
+    with tempfile.TemporaryDirectory() as config_dir:
+        hass = HomeAssistant()
+        hass.config.config_dir = config_dir
+        # the integration is loaded from this checkout
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS, None)
+        async with ClientSession() as websession:
+            api = ReplayCentralUnit(path, records, websession)
+            await api.connect()
+
+            async def _async_get_api_object(*args: Any) -> ReplayCentralUnit:
+                return api
+
+            with patch(
+                "custom_components.switchbee.session.get_api_object",
+                _async_get_api_object,
+            ):
+                coordinator = await _async_setup_entry(hass, api, profile)
+
+                state_writes = 0
+
+                @callback
+                def _async_count_state_write(event: Event) -> None:
+                    nonlocal state_writes
+                    state_writes += 1
+
+                hass.bus.async_listen(EVENT_STATE_CHANGED, _async_count_state_write)
+                coordinator.profiler.reset()
+
+                stats = await async_replay(coordinator, api, speed)
+                await hass.async_block_till_done()
+                stats["entities"] = len(hass.states.async_all())
+                stats["state_writes"] = state_writes
+                if profile:
+                    stats["profile"] = coordinator.profiler.summary()
+
+        await hass.async_stop(force=True)
+
+    print(json.dumps(stats, indent=2))
+
+
+def main() -> None:
+    """Replay a capture."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("capture", help="a switchbee_<unit>_<time>.jsonl.gz file")
+    parser.add_argument(
+        "--speed",
+        default="1",
+        help="replay speed factor, or max to replay without waiting",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="profile the integration during the replay",
+    )
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    speed = None if args.speed == "max" else float(args.speed)
+    asyncio.run(_async_main(args.capture, speed, args.profile))
+
+
+if __name__ == "__main__":
+    main()